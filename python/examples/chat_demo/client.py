@@ -5,21 +5,15 @@ Demonstrates starting and resuming streams with the River client.
 """
 
 import asyncio
-import sys
-from pathlib import Path
 
-# Add packages to path (for local development)
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages" / "river-core"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages" / "river-adapter-fastapi"))
-
-from river_adapter_fastapi import create_river_client
+from river_adapter_fastapi import create_river_client, close_river_clients
 
 
 async def demo_basic_stream():
     """Demonstrate basic stream usage."""
     print("=== Basic Stream Demo ===\n")
 
-    client = create_river_client("http://localhost:8000/api/river")
+    client = create_river_client("http://localhost:8000/api/river", shared=True)
 
     resume_token = None
     chunks = []
@@ -65,7 +59,7 @@ async def demo_resume_stream(resume_token: str):
     print("\n\n=== Resume Stream Demo ===\n")
     print(f"Resuming from token: {resume_token[:20]}...\n")
 
-    client = create_river_client("http://localhost:8000/api/river")
+    client = create_river_client("http://localhost:8000/api/river", shared=True)
 
     def handle_chunk(chunk):
         print(chunk, end="", flush=True)
@@ -112,6 +106,8 @@ async def main():
         print("  1. Redis is running on localhost:6379")
         print("  2. Server is running on localhost:8000")
         print("  3. Run: python server.py")
+    finally:
+        await close_river_clients()
 
 
 if __name__ == "__main__":
@@ -5,13 +5,7 @@ A simple chat server demonstrating River's durable streaming capabilities.
 """
 
 import asyncio
-import sys
-from pathlib import Path
-
-# Add packages to path (for local development)
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages" / "river-core"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages" / "river-provider-redis"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages" / "river-adapter-fastapi"))
+import os
 
 from fastapi import FastAPI, Request
 from pydantic import BaseModel
@@ -70,6 +64,7 @@ chat_stream = (
     create_river_stream()
     .input_schema(ChatInput)
     .provider(provider)
+    .batching(max_bytes=512, max_delay_ms=20)
     .runner(chat_runner)
 )
 
@@ -108,10 +103,17 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
+    # Streams are persisted in Redis, so a stream started on one worker can
+    # be resumed from any other
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
     print("🚀 Starting River Chat Demo Server")
     print("📍 Server: http://localhost:8000")
     print("📖 Docs: http://localhost:8000/docs")
     print("🔴 Redis: redis://localhost:6379")
+    print(f"👷 Workers: {workers}")
     print()
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http default to "auto", which picks uvloop and httptools when
+    # installed (uvicorn[standard])
+    uvicorn.run("server:app", host="0.0.0.0", port=8000, workers=workers)
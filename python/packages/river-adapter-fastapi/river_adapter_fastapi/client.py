@@ -1,9 +1,10 @@
 """FastAPI client-side adapter for River streams."""
 
 from typing import Any, Callable, TypeVar
-import json
 import asyncio
+import weakref
 import httpx
+import orjson
 
 RouterT = TypeVar("RouterT")
 
@@ -11,11 +12,80 @@ RouterT = TypeVar("RouterT")
 class StreamClient:
     """Client for a specific stream."""
 
-    def __init__(self, endpoint: str, stream_key: str):
+    def __init__(self, endpoint: str, stream_key: str, http_client: httpx.AsyncClient):
         self._endpoint = endpoint
         self._stream_key = stream_key
+        self._http = http_client
         self._abort_controller: asyncio.Event | None = None
 
+    async def _read_events(
+        self,
+        response: httpx.Response,
+        on_chunk: Callable[[Any], None] | None,
+        on_special: Callable[[Any], None] | None,
+    ) -> None:
+        """Parse SSE messages from the response and dispatch them to callbacks."""
+        # Frame on raw bytes so each complete message payload goes straight
+        # to the JSON parser
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            buffer.extend(chunk)
+
+            # Process complete SSE messages
+            idx = buffer.find(b"\n\n")
+            while idx != -1:
+                message = bytes(buffer[:idx])
+                del buffer[: idx + 2]
+                idx = buffer.find(b"\n\n")
+
+                # Parse SSE message
+                if message.startswith(b"data: "):
+                    try:
+                        # Remove "data: " prefix; orjson parses bytes directly
+                        item = orjson.loads(message[6:])
+                    except orjson.JSONDecodeError:
+                        continue
+
+                    # Handle different item types
+                    if item["type"] == "chunk":
+                        if on_chunk:
+                            on_chunk(item["chunk"])
+                    elif item["type"] == "special":
+                        if on_special:
+                            on_special(item["special"])
+                    elif item["type"] == "aborted":
+                        return
+
+    async def _consume(
+        self,
+        response: httpx.Response,
+        abort_event: asyncio.Event,
+        on_chunk: Callable[[Any], None] | None,
+        on_special: Callable[[Any], None] | None,
+    ) -> None:
+        """
+        Read the SSE stream until it ends or the stream is aborted.
+
+        The read runs in its own task so that abort() cancels a pending
+        socket read immediately instead of waiting for the next chunk.
+        """
+        read_task = asyncio.ensure_future(self._read_events(response, on_chunk, on_special))
+        abort_task = asyncio.ensure_future(abort_event.wait())
+        try:
+            await asyncio.wait({read_task, abort_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            abort_task.cancel()
+            if not read_task.done():
+                read_task.cancel()
+                try:
+                    await read_task
+                except asyncio.CancelledError:
+                    pass
+
+        if not read_task.cancelled():
+            # Propagate read errors to the caller's error handling
+            read_task.result()
+
     async def start(
         self,
         input_data: dict[str, Any],
@@ -34,65 +104,35 @@ class StreamClient:
             on_error: Callback for errors
             on_complete: Callback for stream completion
         """
-        self._abort_controller = asyncio.Event()
-
-        async with httpx.AsyncClient() as client:
-            request_body = {
-                "router_stream_key": self._stream_key,
-                "input": input_data,
-            }
-
-            try:
-                async with client.stream(
-                    "POST",
-                    self._endpoint,
-                    json=request_body,
-                    headers={"Accept": "text/event-stream"},
-                    timeout=None,
-                ) as response:
-                    response.raise_for_status()
-
-                    # Process SSE stream
-                    buffer = ""
-                    async for chunk in response.aiter_text():
-                        if self._abort_controller.is_set():
-                            break
-
-                        buffer += chunk
-
-                        # Process complete SSE messages
-                        while "\n\n" in buffer:
-                            message, buffer = buffer.split("\n\n", 1)
-
-                            # Parse SSE message
-                            if message.startswith("data: "):
-                                data_str = message[6:]  # Remove "data: " prefix
-                                try:
-                                    item = json.loads(data_str)
-
-                                    # Handle different item types
-                                    if item["type"] == "chunk":
-                                        if on_chunk:
-                                            on_chunk(item["chunk"])
-                                    elif item["type"] == "special":
-                                        if on_special:
-                                            on_special(item["special"])
-                                    elif item["type"] == "aborted":
-                                        break
-
-                                except json.JSONDecodeError:
-                                    pass
-
-                    # Stream completed
-                    if on_complete:
-                        on_complete()
-
-            except httpx.HTTPError as e:
-                if on_error:
-                    on_error({"message": str(e), "type": "network"})
-            except Exception as e:
-                if on_error:
-                    on_error({"message": str(e), "type": "unknown"})
+        abort_event = self._abort_controller = asyncio.Event()
+
+        request_body = {
+            "router_stream_key": self._stream_key,
+            "input": input_data,
+        }
+
+        try:
+            async with self._http.stream(
+                "POST",
+                self._endpoint,
+                json=request_body,
+                headers={"Accept": "text/event-stream"},
+                timeout=None,
+            ) as response:
+                response.raise_for_status()
+
+                await self._consume(response, abort_event, on_chunk, on_special)
+
+                # Stream completed
+                if on_complete:
+                    on_complete()
+
+        except httpx.HTTPError as e:
+            if on_error:
+                on_error({"message": str(e), "type": "network"})
+        except Exception as e:
+            if on_error:
+                on_error({"message": str(e), "type": "unknown"})
 
     async def resume(
         self,
@@ -112,55 +152,28 @@ class StreamClient:
             on_error: Callback for errors
             on_complete: Callback for stream completion
         """
-        self._abort_controller = asyncio.Event()
-
-        async with httpx.AsyncClient() as client:
-            try:
-                async with client.stream(
-                    "GET",
-                    f"{self._endpoint}?resumeKey={resume_key}",
-                    headers={"Accept": "text/event-stream"},
-                    timeout=None,
-                ) as response:
-                    response.raise_for_status()
-
-                    # Process SSE stream (same as start)
-                    buffer = ""
-                    async for chunk in response.aiter_text():
-                        if self._abort_controller.is_set():
-                            break
-
-                        buffer += chunk
-
-                        while "\n\n" in buffer:
-                            message, buffer = buffer.split("\n\n", 1)
-
-                            if message.startswith("data: "):
-                                data_str = message[6:]
-                                try:
-                                    item = json.loads(data_str)
-
-                                    if item["type"] == "chunk":
-                                        if on_chunk:
-                                            on_chunk(item["chunk"])
-                                    elif item["type"] == "special":
-                                        if on_special:
-                                            on_special(item["special"])
-                                    elif item["type"] == "aborted":
-                                        break
-
-                                except json.JSONDecodeError:
-                                    pass
-
-                    if on_complete:
-                        on_complete()
-
-            except httpx.HTTPError as e:
-                if on_error:
-                    on_error({"message": str(e), "type": "network"})
-            except Exception as e:
-                if on_error:
-                    on_error({"message": str(e), "type": "unknown"})
+        abort_event = self._abort_controller = asyncio.Event()
+
+        try:
+            async with self._http.stream(
+                "GET",
+                f"{self._endpoint}?resumeKey={resume_key}",
+                headers={"Accept": "text/event-stream"},
+                timeout=None,
+            ) as response:
+                response.raise_for_status()
+
+                await self._consume(response, abort_event, on_chunk, on_special)
+
+                if on_complete:
+                    on_complete()
+
+        except httpx.HTTPError as e:
+            if on_error:
+                on_error({"message": str(e), "type": "network"})
+        except Exception as e:
+            if on_error:
+                on_error({"message": str(e), "type": "unknown"})
 
     def abort(self) -> None:
         """Abort the current stream."""
@@ -171,32 +184,73 @@ class StreamClient:
 class RiverClient:
     """Client for a River router."""
 
-    def __init__(self, endpoint: str):
+    def __init__(self, endpoint: str, http2: bool = True):
         self._endpoint = endpoint
         self._streams: dict[str, StreamClient] = {}
+        # One pooled HTTP client shared by every stream, so connections are
+        # kept alive and reused instead of re-handshaking per stream. With
+        # HTTP/2, concurrent streams are multiplexed over one connection.
+        self._http = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=None,
+        )
+
+    def stream(self, name: str) -> StreamClient:
+        """Get client for a specific stream by name."""
+        stream_client = self._streams.get(name)
+        if stream_client is None:
+            stream_client = StreamClient(self._endpoint, name, self._http)
+            self._streams[name] = stream_client
+        return stream_client
 
     def __getattr__(self, name: str) -> StreamClient:
-        """Get client for a specific stream."""
-        if name not in self._streams:
-            self._streams[name] = StreamClient(self._endpoint, name)
-        return self._streams[name]
+        """Get client for a specific stream (shorthand for ``stream(name)``)."""
+        # Private and dunder lookups (copy, pickle, introspection) must not
+        # create stream clients
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.stream(name)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
 
 
-def create_river_client(endpoint: str) -> RiverClient:
+# Shared clients per event loop, then per (endpoint, http2): an httpx
+# client is bound to the loop it was first used on
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, bool], RiverClient]
+] = weakref.WeakKeyDictionary()
+
+
+def create_river_client(
+    endpoint: str, http2: bool = True, shared: bool = False
+) -> RiverClient:
     """
-    Create a River client for a FastAPI endpoint.
+    Get a River client for a FastAPI endpoint.
+
+    By default every call returns a new client with its own connection
+    pool. With ``shared=True``, calls made on the same event loop return
+    the same client per endpoint, and with it the same pool of open
+    connections; a closed client is replaced by a fresh one. Shared clients
+    must be requested from a running event loop and are closed with
+    ``close_river_clients()``.
 
     Args:
         endpoint: The URL of the River endpoint (e.g., "http://localhost:8000/api/river")
+        http2: Negotiate HTTP/2 when the server supports it (requires TLS;
+            plain-HTTP endpoints and HTTP/1.1-only servers use HTTP/1.1)
+        shared: Reuse one client per endpoint on the running event loop
 
     Returns:
         A client that can start and resume streams
 
     Example:
         ```python
-        client = create_river_client("http://localhost:8000/api/river")
+        client = create_river_client("http://localhost:8000/api/river", shared=True)
 
-        # Start a stream
+        # Start a stream (client.chat is shorthand for client.stream("chat"))
         await client.chat.start(
             input_data={"prompt": "Hello"},
             on_chunk=lambda chunk: print(chunk),
@@ -208,6 +262,25 @@ def create_river_client(endpoint: str) -> RiverClient:
             resume_key=token,
             on_chunk=lambda chunk: print(chunk),
         )
+
+        # Release pooled connections on shutdown
+        await close_river_clients()
         ```
     """
-    return RiverClient(endpoint)
+    if not shared:
+        return RiverClient(endpoint, http2=http2)
+
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    key = (endpoint, http2)
+    client = loop_clients.get(key)
+    if client is None or client._http.is_closed:
+        client = RiverClient(endpoint, http2=http2)
+        loop_clients[key] = client
+    return client
+
+
+async def close_river_clients() -> None:
+    """Close the shared clients of the running event loop (e.g. on app shutdown)."""
+    loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in loop_clients.values():
+        await client.aclose()
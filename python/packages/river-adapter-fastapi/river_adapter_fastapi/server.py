@@ -1,13 +1,16 @@
 """FastAPI server-side adapter for River streams."""
 
-from typing import Any
-import json
+from typing import Any, Callable
+import asyncio
+import contextlib
+import orjson
 from fastapi import Request, Response, HTTPException
 from fastapi.responses import StreamingResponse
-from sse_starlette.sse import EventSourceResponse
+from starlette.types import Receive, Scope, Send
 from pydantic import BaseModel, ValidationError
 from river_core import create_server_side_caller, RiverRouter
 from river_core.errors import RiverError
+from river_core.helpers import decode_resumption_token
 
 
 class StartStreamRequest(BaseModel):
@@ -17,24 +20,162 @@ class StartStreamRequest(BaseModel):
     input: dict[str, Any]
 
 
-async def _sse_generator(items_iter: Any) -> Any:
+# Headers for SSE responses; X-Accel-Buffering stops proxies such as nginx
+# from buffering the stream
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# SSE frame delimiters: "data: {json}\n\n"
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Marks the end of the items read for a batched SSE response
+_END_OF_ITEMS = object()
+
+# How long a start request may wait for a free stream slot before being
+# rejected with 503
+_IN_FLIGHT_WAIT_SECONDS = 1.0
+
+
+class _SSEResponse(StreamingResponse):
+    """Streaming response that runs a callback once it has finished."""
+
+    def __init__(self, content: Any, on_close: Callable[[], None] | None = None, **kwargs: Any):
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+
+async def _sse_generator(items_iter: Any, batch_size: int = 1) -> Any:
     """
     Convert stream items to SSE format.
 
+    With ``batch_size`` > 1, a single task reads the items into a small
+    queue, and every write takes all frames that are already waiting (up to
+    ``batch_size``), so items produced while a write is in progress go out
+    together. Each item is still sent as its own SSE event.
+
     Args:
         items_iter: Async iterator of stream items
+        batch_size: Maximum number of frames to coalesce into one write
 
     Yields:
-        SSE-formatted data
+        Encoded SSE frames, ready to be written to the response
+    """
+    if batch_size <= 1:
+        async for item in items_iter:
+            yield _SSE_PREFIX + orjson.dumps(item) + _SSE_SUFFIX
+        return
+
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=batch_size)
+    error: BaseException | None = None
+
+    async def read_items() -> None:
+        nonlocal error
+        try:
+            async for item in items_iter:
+                await queue.put(item)
+        except Exception as e:
+            error = e
+        await queue.put(_END_OF_ITEMS)
+
+    reader = asyncio.ensure_future(read_items())
+    try:
+        while True:
+            item = await queue.get()
+            frames: list[bytes] = []
+            while item is not _END_OF_ITEMS:
+                frames.append(_SSE_PREFIX + orjson.dumps(item) + _SSE_SUFFIX)
+                if len(frames) >= batch_size or not queue.qsize():
+                    break
+                item = queue.get_nowait()
+            if frames:
+                yield b"".join(frames)
+            if item is _END_OF_ITEMS:
+                break
+        if error is not None:
+            raise error
+    finally:
+        if not reader.done():
+            reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader
+
+
+def _sse_response(
+    items_iter: Any,
+    batch_size: int = 1,
+    on_close: Callable[[], None] | None = None,
+) -> StreamingResponse:
+    """
+    Wrap stream items in a streaming SSE response.
+
+    No heartbeat task runs alongside the stream; completion is signalled by
+    River's own stream_end/stream_fatal_error special chunks.
+
+    Args:
+        items_iter: Async iterator of stream items
+        batch_size: Maximum number of frames to coalesce into one write
+        on_close: Called once the response has finished, including when the
+            client disconnects
     """
-    async for item in items_iter:
-        # Serialize item to JSON
-        json_data = json.dumps(item)
-        # Yield in SSE format: "data: {json}\n\n"
-        yield {"data": json_data}
+    return _SSEResponse(
+        _sse_generator(items_iter, batch_size),
+        on_close=on_close,
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
 
 
-def river_endpoint_handler(router: RiverRouter) -> dict[str, Any]:
+async def _read_body(request: Request, max_body_bytes: int | None) -> bytes | bytearray:
+    """
+    Read the request body, enforcing an optional size limit.
+
+    With a limit set, the body is read incrementally and the request is
+    rejected as soon as the limit is exceeded, without buffering the rest.
+
+    Args:
+        request: The incoming request
+        max_body_bytes: Maximum accepted body size, or None for no limit
+
+    Returns:
+        The raw request body
+
+    Raises:
+        HTTPException: 413 if the body exceeds ``max_body_bytes``
+    """
+    if max_body_bytes is None:
+        return await request.body()
+
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit():
+        if int(content_length) > max_body_bytes:
+            raise HTTPException(status_code=413, detail="Request body too large")
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_body_bytes:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    return body
+
+
+def river_endpoint_handler(
+    router: RiverRouter,
+    max_body_bytes: int | None = None,
+    sse_batch_size: int = 1,
+    max_in_flight: int | None = None,
+    validation_cache: int = 0,
+) -> dict[str, Any]:
     """
     Create FastAPI endpoint handlers for a River router.
 
@@ -42,6 +183,14 @@ def river_endpoint_handler(router: RiverRouter) -> dict[str, Any]:
 
     Args:
         router: The River router containing stream definitions
+        max_body_bytes: Optional limit on the POST body size; larger requests
+            are rejected with 413 before the whole body is read
+        sse_batch_size: Maximum number of waiting SSE frames coalesced into
+            a single write (1, the default, writes every frame on its own)
+        max_in_flight: Optional limit on concurrently running started
+            streams; excess start requests wait briefly, then get 503
+        validation_cache: Number of validated inputs to memoize per stream
+            (0 disables; only used for streams with frozen input models)
 
     Returns:
         Dict with 'post' and 'get' handler functions
@@ -63,14 +212,15 @@ def river_endpoint_handler(router: RiverRouter) -> dict[str, Any]:
             return await handlers["get"](request)
         ```
     """
-    caller = create_server_side_caller(router)
+    caller = create_server_side_caller(router, validation_cache=validation_cache)
+    in_flight = asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
 
     async def post_handler(request: Request) -> Response:
         """Handle POST requests to start a new stream."""
         try:
-            # Parse request body
-            body = await request.json()
-            start_request = StartStreamRequest(**body)
+            # Parse and validate the raw body in a single pass
+            body = await _read_body(request, max_body_bytes)
+            start_request = StartStreamRequest.model_validate_json(body)
 
             # Get the stream caller
             try:
@@ -78,19 +228,37 @@ def river_endpoint_handler(router: RiverRouter) -> dict[str, Any]:
             except RiverError as e:
                 raise HTTPException(status_code=404, detail=str(e))
 
-            # Start the stream
-            items_iter = stream_caller.start(
+            # Validate the input; the stream itself only runs once the
+            # response is iterated
+            items_iter = stream_caller.prepare(
                 input_data=start_request.input,
                 adapter_request=request,
             )
 
+            # Wait for a free stream slot; the slot is held until the
+            # response finishes
+            if in_flight is not None:
+                try:
+                    await asyncio.wait_for(in_flight.acquire(), _IN_FLIGHT_WAIT_SECONDS)
+                except asyncio.TimeoutError:
+                    raise HTTPException(
+                        status_code=503, detail="Too many concurrent streams"
+                    )
+
             # Return SSE response
-            return EventSourceResponse(_sse_generator(items_iter))
+            return _sse_response(
+                items_iter,
+                sse_batch_size,
+                on_close=in_flight.release if in_flight is not None else None,
+            )
 
+        except HTTPException:
+            raise
         except ValidationError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except RiverError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+            # Structured detail, so input validation errors reach the client
+            raise HTTPException(status_code=400, detail=e.to_dict())
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -105,8 +273,6 @@ def river_endpoint_handler(router: RiverRouter) -> dict[str, Any]:
                 )
 
             # Decode resumption token to get stream key
-            from river_core.helpers import decode_resumption_token
-
             try:
                 token = decode_resumption_token(resume_key)
                 router_stream_key = token["router_stream_key"]
@@ -123,7 +289,7 @@ def river_endpoint_handler(router: RiverRouter) -> dict[str, Any]:
             items_iter = stream_caller.resume(resume_key)
 
             # Return SSE response
-            return EventSourceResponse(_sse_generator(items_iter))
+            return _sse_response(items_iter, sse_batch_size)
 
         except HTTPException:
             raise
@@ -0,0 +1,167 @@
+"""Tests for the FastAPI client."""
+
+import asyncio
+import httpx
+import orjson
+import pytest
+from river_adapter_fastapi import create_river_client, close_river_clients
+from river_adapter_fastapi.client import StreamClient
+
+
+@pytest.mark.asyncio
+async def test_create_river_client_returns_new_client():
+    """Test that clients are not shared unless requested."""
+    client = create_river_client("http://test/api/river")
+    other = create_river_client("http://test/api/river")
+
+    assert other is not client
+
+    await client.aclose()
+    await other.aclose()
+
+
+@pytest.mark.asyncio
+async def test_create_river_client_is_shared_per_endpoint():
+    """Test that shared clients are reused per endpoint."""
+    client = create_river_client("http://test/api/river", shared=True)
+
+    assert create_river_client("http://test/api/river", shared=True) is client
+    assert create_river_client("http://other/api/river", shared=True) is not client
+    assert client.chat is client.stream("chat")
+
+    await close_river_clients()
+
+
+@pytest.mark.asyncio
+async def test_create_river_client_replaces_closed_client():
+    """Test that a closed client is not handed out again."""
+    client = create_river_client("http://test/api/river", shared=True)
+    await client.aclose()
+
+    assert create_river_client("http://test/api/river", shared=True) is not client
+
+    await close_river_clients()
+
+
+def test_shared_client_per_event_loop():
+    """Test that each event loop gets its own shared client."""
+
+    async def get_client():
+        return create_river_client("http://test/api/river", shared=True)
+
+    async def get_and_close_client():
+        client = await get_client()
+        await close_river_clients()
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_and_close_client())
+
+    assert second is not first
+    asyncio.run(first.aclose())
+
+
+@pytest.mark.asyncio
+async def test_river_client_private_attribute_lookup():
+    """Test that private lookups do not create stream clients."""
+    client = create_river_client("http://test/api/river")
+
+    with pytest.raises(AttributeError):
+        client._missing
+
+    await client.aclose()
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Response body delivered in the given network chunks."""
+
+    def __init__(self, chunks: list[bytes], hang: asyncio.Event | None = None):
+        self.chunks = chunks
+        # When set, the read after the last chunk waits on this event
+        self.hang = hang
+        self.cancelled = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.hang is not None:
+            try:
+                await self.hang.wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+
+def _stream_client(body: _ChunkedStream) -> StreamClient:
+    """Create a StreamClient whose requests are answered with body."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=body
+        )
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return StreamClient("http://test/api/river", "chat", http)
+
+
+def _sse(item: dict) -> bytes:
+    return b"data: " + orjson.dumps(item) + b"\n\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_client_events_split_across_chunks():
+    """Test that SSE messages split at any byte are reassembled."""
+    text = "h\u00e9llo \U0001f600"
+    payload = (
+        _sse({"type": "special", "special": {"type": "stream_start"}})
+        + _sse({"type": "chunk", "chunk": text})
+        + _sse({"type": "chunk", "chunk": 2})
+        + _sse({"type": "special", "special": {"type": "stream_end"}})
+    )
+    # Split inside the multi-byte encodings of both non-ASCII characters
+    first = payload.index("\u00e9".encode()) + 1
+    second = payload.index("\U0001f600".encode()) + 2
+    chunks = [payload[:3], payload[3:first], payload[first:second], payload[second:]]
+    # Split every byte apart too
+    for body in (chunks, [payload[i : i + 1] for i in range(len(payload))]):
+        client = _stream_client(_ChunkedStream(body))
+        received = []
+        specials = []
+        errors = []
+        await client.start(
+            {},
+            on_chunk=received.append,
+            on_special=lambda special: specials.append(special["type"]),
+            on_error=errors.append,
+        )
+        await client._http.aclose()
+
+        assert errors == []
+        assert received == [text, 2]
+        assert specials == ["stream_start", "stream_end"]
+
+
+@pytest.mark.asyncio
+async def test_stream_client_abort_during_pending_read():
+    """Test that abort() cancels a read that is waiting for data."""
+    body = _ChunkedStream(
+        [_sse({"type": "chunk", "chunk": "first"})], hang=asyncio.Event()
+    )
+    client = _stream_client(body)
+    received = []
+    completed = asyncio.Event()
+
+    task = asyncio.create_task(
+        client.start({}, on_chunk=received.append, on_complete=completed.set)
+    )
+    while not received:
+        await asyncio.sleep(0.01)
+
+    # The read of the next chunk is pending; abort must not wait for it
+    client.abort()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert received == ["first"]
+    assert body.cancelled
+    assert completed.is_set()
+    await client._http.aclose()
@@ -24,7 +24,7 @@ class ChatInput(BaseModel):
 def create_test_app(redis_url):
     """Factory for creating test FastAPI apps."""
 
-    def _create_app(runner_fn):
+    def _create_app(runner_fn, **handler_kwargs):
         app = FastAPI()
 
         stream = (
@@ -35,7 +35,7 @@ def create_test_app(redis_url):
         )
 
         router = create_river_router({"chat": stream})
-        handlers = river_endpoint_handler(router)
+        handlers = river_endpoint_handler(router, **handler_kwargs)
 
         @app.post("/api/river")
         async def start(request: Request):
@@ -120,6 +120,31 @@ async def test_fastapi_validation_error(create_test_app):
 
         # Should return 400 for validation error
         assert response.status_code == 400
+        detail = response.json()["detail"]
+        assert detail["error_type"] == "VALIDATION"
+        assert detail["details"]["errors"][0]["type"] == "missing"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_fastapi_body_too_large(create_test_app):
+    """Test that oversized request bodies are rejected."""
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.close()
+
+    app = create_test_app(test_runner, max_body_bytes=64)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/river",
+            json={"router_stream_key": "chat", "input": {"prompt": "x" * 100}},
+            headers={"Accept": "text/event-stream"},
+        )
+
+        # Should return 413
+        assert response.status_code == 413
 
 
 @pytest.mark.integration
@@ -283,3 +308,101 @@ async def test_fastapi_concurrent_requests(create_test_app):
 
     # All should succeed
     assert all(status == 200 for status in results)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_fastapi_sse_batching(create_test_app):
+    """Test that batched SSE writes still deliver every item as its own event."""
+
+    async def test_runner(ctx: StreamContext):
+        for i in range(ctx.input.count):
+            await ctx.stream.append_chunk(f"chunk-{i}")
+        await ctx.stream.close()
+
+    app = create_test_app(test_runner, sse_batch_size=4)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async with client.stream(
+            "POST",
+            "/api/river",
+            json={"router_stream_key": "chat", "input": {"prompt": "test", "count": 10}},
+            headers={"Accept": "text/event-stream"},
+        ) as response:
+            assert response.status_code == 200
+
+            chunks, special_chunks = await parse_sse_stream(response)
+
+            assert chunks == [f"chunk-{i}" for i in range(10)]
+            assert [s["type"] for s in special_chunks] == ["stream_start", "stream_end"]
+
+
+@pytest.mark.asyncio
+async def test_sse_generator_coalesces_ready_items():
+    """Test that waiting items share a write, capped at the batch size."""
+    from river_adapter_fastapi.server import _sse_generator
+
+    async def items():
+        for i in range(10):
+            yield {"type": "chunk", "chunk": i}
+
+    writes = [write async for write in _sse_generator(items(), batch_size=4)]
+
+    frames = [frame for write in writes for frame in write.split(b"\n\n") if frame]
+    assert [json.loads(frame[6:])["chunk"] for frame in frames] == list(range(10))
+    assert len(writes) < 10
+    assert all(write.count(b"data: ") <= 4 for write in writes)
+
+
+@pytest.mark.asyncio
+async def test_sse_generator_batched_error():
+    """Test that a failing source sends what it produced, then raises."""
+    from river_adapter_fastapi.server import _sse_generator
+
+    async def items():
+        yield {"type": "chunk", "chunk": 0}
+        raise ValueError("source failed")
+
+    writes = []
+    with pytest.raises(ValueError, match="source failed"):
+        async for write in _sse_generator(items(), batch_size=4):
+            writes.append(write)
+
+    assert b"".join(writes) == b'data: {"type":"chunk","chunk":0}\n\n'
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_fastapi_max_in_flight(create_test_app, monkeypatch):
+    """Test that start requests beyond max_in_flight are rejected."""
+    from river_adapter_fastapi import server
+
+    monkeypatch.setattr(server, "_IN_FLIGHT_WAIT_SECONDS", 0.05)
+    release = asyncio.Event()
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("held")
+        await release.wait()
+        await ctx.stream.close()
+
+    app = create_test_app(test_runner, max_in_flight=1)
+    transport = httpx.ASGITransport(app=app)
+    body = {"router_stream_key": "chat", "input": {"prompt": "test"}}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def held_stream():
+            async with client.stream("POST", "/api/river", json=body) as response:
+                await parse_sse_stream(response)
+                return response.status_code
+
+        first = asyncio.create_task(held_stream())
+        await asyncio.sleep(0.1)
+
+        # The only slot is taken by the first stream
+        response = await client.post("/api/river", json=body)
+        assert response.status_code == 503
+
+        release.set()
+        assert await first == 200
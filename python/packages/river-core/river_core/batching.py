@@ -0,0 +1,150 @@
+"""Chunk coalescing for River streams."""
+
+from typing import Any, Callable
+import asyncio
+from .types import StreamHelper, StreamContext
+from .errors import RiverError
+
+
+class BatchingStreamHelper(StreamHelper[Any]):
+    """
+    Stream helper that coalesces small string chunks.
+
+    String chunks are buffered and forwarded to the wrapped helper as a
+    single joined chunk once ``max_bytes`` have accumulated or
+    ``max_delay_ms`` have passed since the first buffered chunk, whichever
+    comes first. Non-string chunks, errors and close flush the buffer first
+    so ordering is preserved.
+    """
+
+    def __init__(
+        self,
+        inner: StreamHelper[Any],
+        max_bytes: int = 512,
+        max_delay_ms: float = 20,
+    ):
+        self._inner = inner
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay_ms / 1000
+        self._buffer: list[str] = []
+        self._buffered_bytes = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Future[None] | None = None
+
+    def _take(self) -> str | None:
+        """Remove and return the buffered chunks as one string."""
+        if not self._buffer:
+            return None
+        batch = "".join(self._buffer)
+        self._buffer = []
+        self._buffered_bytes = 0
+        return batch
+
+    def _arm_timer(self) -> None:
+        """Start the delay window for the buffered chunks."""
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self._max_delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """Flush the buffer when the delay window expires."""
+        self._timer = None
+        task = self._flush_task
+        if task is not None:
+            if not task.done() or task.cancelled() or task.exception() is not None:
+                # Keep buffering: a pending flush re-arms the timer when it
+                # completes, and a failed one is raised by the next append
+                return
+            self._flush_task = None
+        batch = self._take()
+        if batch is not None:
+            self._flush_task = asyncio.ensure_future(self._inner.append_chunk(batch))
+            self._flush_task.add_done_callback(self._on_flushed)
+
+    def _on_flushed(self, task: "asyncio.Future[None]") -> None:
+        """Start the next delay window for chunks buffered during a flush."""
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._buffer and self._timer is None:
+            self._arm_timer()
+
+    async def _wait_flush(self) -> None:
+        """Wait for a pending timer flush, raising its error if it failed."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            await task
+
+    async def flush(self) -> None:
+        """Forward any buffered chunks to the wrapped helper."""
+        # An earlier timer flush carries older chunks
+        await self._wait_flush()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._take()
+        if batch is not None:
+            await self._inner.append_chunk(batch)
+
+    async def append_chunk(self, chunk: Any) -> None:
+        """Buffer a string chunk, or flush and forward any other chunk."""
+        if not isinstance(chunk, str):
+            await self.flush()
+            await self._inner.append_chunk(chunk)
+            return
+
+        # At most one timer flush is in flight; waiting for it here passes
+        # the wrapped helper's backpressure on to the runner
+        if self._flush_task is not None:
+            await self._wait_flush()
+
+        self._buffer.append(chunk)
+        self._buffered_bytes += len(chunk.encode("utf-8"))
+
+        if self._buffered_bytes >= self._max_bytes:
+            await self.flush()
+        elif self._timer is None:
+            self._arm_timer()
+
+    async def append_error(self, error: RiverError) -> None:
+        """Flush buffered chunks, then append a recoverable error."""
+        await self.flush()
+        await self._inner.append_error(error)
+
+    async def send_fatal_error_and_close(self, error: RiverError) -> None:
+        """Flush buffered chunks, then send a fatal error and close."""
+        await self.flush()
+        await self._inner.send_fatal_error_and_close(error)
+
+    async def close(self) -> None:
+        """Flush buffered chunks and close the stream."""
+        await self.flush()
+        await self._inner.close()
+
+
+def batched_runner(
+    runner: Callable[[StreamContext[Any, Any, Any]], Any],
+    max_bytes: int,
+    max_delay_ms: float,
+) -> Callable[[StreamContext[Any, Any, Any]], Any]:
+    """
+    Wrap a runner so its stream helper coalesces chunks.
+
+    Args:
+        runner: The stream runner to wrap
+        max_bytes: Flush once this many UTF-8 bytes are buffered
+        max_delay_ms: Flush at most this long after the first buffered chunk
+
+    Returns:
+        A runner that installs a BatchingStreamHelper around ``ctx.stream``
+    """
+
+    async def run(context: StreamContext[Any, Any, Any]) -> None:
+        helper = BatchingStreamHelper(
+            context.stream, max_bytes=max_bytes, max_delay_ms=max_delay_ms
+        )
+        context.stream = helper
+        try:
+            await runner(context)
+        finally:
+            await helper.flush()
+
+    return run
@@ -1,57 +1,144 @@
 """Server and client-side caller implementations."""
 
-from typing import Any, AsyncIterator, TypeVar
+from typing import Any, AsyncIterator, Callable, TypeVar
+from functools import lru_cache
 from pydantic import ValidationError
-import base64
-import json
 from .types import (
     RiverRouter,
     RiverStream,
     StreamContext,
     CallerStreamItem,
-    ResumptionToken,
     AbortSignal,
 )
 from .errors import RiverError, RiverErrorType
+from .helpers import decode_resumption_token
 
 InputT = TypeVar("InputT")
 AdapterRequestT = TypeVar("AdapterRequestT")
 
+# Input values that can be part of a validation cache key
+_CACHEABLE_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _validation_cache_key(input_data: dict[str, Any]) -> tuple[Any, ...] | None:
+    """
+    Build a cache key for flat inputs of primitive values.
+
+    Each value's type is part of the key, since e.g. ``True == 1``.
+
+    Returns:
+        The key, or None if the input cannot be cached
+    """
+    key = []
+    for name, value in input_data.items():
+        value_type = value.__class__
+        if value_type not in _CACHEABLE_VALUE_TYPES:
+            return None
+        key.append((name, value_type, value))
+    return tuple(key)
+
 
 class StreamCaller:
     """Caller for a specific stream."""
 
-    def __init__(self, stream: RiverStream[Any, Any, Any]):
+    def __init__(self, stream: RiverStream[Any, Any, Any], validation_cache: int = 0):
+        """
+        Create a caller for a stream.
+
+        Args:
+            stream: The stream definition
+            validation_cache: Number of validated inputs to memoize (0
+                disables). Opt-in, and only used for frozen input models: the
+                same model instance is handed to every run with an equal
+                input, so field defaults are not recomputed per run. Only
+                flat inputs of primitive values are cached.
+        """
         self._stream = stream
+        # Resolve the model's core validator once instead of going through
+        # the model constructor on every start()
+        self._validate_input = stream.input_model.__pydantic_validator__.validate_python
+        self._validate_cached: Callable[[tuple[Any, ...]], Any] | None = None
+        if validation_cache > 0 and stream.input_model.model_config.get("frozen", False):
+            validate = self._validate_input
+            self._validate_cached = lru_cache(maxsize=validation_cache)(
+                lambda key: validate({name: value for name, _, value in key})
+            )
 
-    async def start(
+    def _validate(self, input_data: dict[str, Any]) -> Any:
+        """Validate input data, using the validation cache when enabled."""
+        if self._validate_cached is not None:
+            key = _validation_cache_key(input_data)
+            if key is not None:
+                return self._validate_cached(key)
+        return self._validate_input(input_data)
+
+    def prepare(
         self,
         input_data: dict[str, Any],
         adapter_request: Any,
     ) -> AsyncIterator[CallerStreamItem[Any]]:
         """
-        Start a new stream.
+        Validate input and return the stream's items, without starting it.
+
+        Unlike start(), input is validated right away, so adapters can
+        reject invalid requests before they begin a response. The stream
+        runs once the returned iterator is iterated.
 
         Args:
             input_data: Input data to validate against the stream's schema
             adapter_request: Framework-specific request object
 
-        Yields:
-            Stream items (chunks, special chunks, aborted)
+        Returns:
+            Async iterator of stream items (chunks, special chunks, aborted)
+
+        Raises:
+            RiverError: If input validation fails; the validation errors are
+                in ``details["errors"]``
         """
-        # Validate input
         try:
-            validated_input = self._stream.input_model(**input_data)
+            validated_input = self._validate(input_data)
         except ValidationError as e:
+            # Constant message: rendering every error entry into a string is
+            # wasted work when the structured errors are attached anyway
             raise RiverError(
-                message=f"Input validation failed: {e}",
+                message="Input validation failed",
                 error_type=RiverErrorType.VALIDATION,
-                details={"errors": e.errors()},
+                details={"errors": e.errors(include_url=False, include_context=False)},
             )
 
+        return self._run(validated_input, adapter_request)
+
+    async def start(
+        self,
+        input_data: dict[str, Any],
+        adapter_request: Any,
+    ) -> AsyncIterator[CallerStreamItem[Any]]:
+        """
+        Start a new stream.
+
+        Input is validated when iteration begins; see prepare() to validate
+        up front.
+
+        Args:
+            input_data: Input data to validate against the stream's schema
+            adapter_request: Framework-specific request object
+
+        Yields:
+            Stream items (chunks, special chunks, aborted)
+
+        Raises:
+            RiverError: If input validation fails
+        """
+        async for item in self.prepare(input_data, adapter_request):
+            yield item
+
+    async def _run(
+        self, validated_input: Any, adapter_request: Any
+    ) -> AsyncIterator[CallerStreamItem[Any]]:
+        """Run the stream with already validated input."""
         # Create context
         abort_signal = AbortSignal()
-        context = StreamContext[Any, Any, Any]()
+        context: StreamContext[Any, Any, Any] = StreamContext()
         context.input = validated_input
         context.adapter_request = adapter_request
         context.abort_signal = abort_signal
@@ -61,6 +148,7 @@ class StreamCaller:
             stream_storage_id=self._stream.stream_storage_id,
             runner=self._stream.runner,
             context=context,
+            runner_is_generator=self._stream.runner_is_generator,
         ):
             if abort_signal.aborted:
                 yield {"type": "aborted"}
@@ -81,12 +169,12 @@ class StreamCaller:
         """
         # Decode resumption token
         try:
-            token_data = json.loads(base64.b64decode(resume_key).decode("utf-8"))
-            resumption_token = ResumptionToken(**token_data)  # type: ignore
-        except Exception as e:
+            resumption_token = decode_resumption_token(resume_key)
+        except ValueError as e:
             raise RiverError(
-                message=f"Invalid resumption token: {e}",
+                message=str(e),
                 error_type=RiverErrorType.INVALID_RESUMPTION_TOKEN,
+                details={"cause": repr(e.__cause__)},
             )
 
         # Resume via provider
@@ -97,34 +185,41 @@ class StreamCaller:
 class ServerSideCaller:
     """Server-side caller with access to all streams in a router."""
 
-    def __init__(self, router: RiverRouter):
+    def __init__(self, router: RiverRouter, validation_cache: int = 0):
         self._router = router
-        self._callers = {
-            key: StreamCaller(stream) for key, stream in router.items()
-        }
+        self._callers: dict[str, StreamCaller] = {}
+        for key, stream in router.items():
+            stream_caller = StreamCaller(stream, validation_cache=validation_cache)
+            self._callers[key] = stream_caller
+            # Bind as a real attribute so caller.<key> is a plain instance
+            # lookup; keys that would shadow the caller's own attributes are
+            # only reachable through get_stream()
+            if key.isidentifier() and not hasattr(self, key):
+                setattr(self, key, stream_caller)
 
     def __getattr__(self, name: str) -> StreamCaller:
-        """Get caller for a specific stream."""
-        if name in self._callers:
-            return self._callers[name]
+        """Only reached for names that are not a bound stream."""
         raise AttributeError(f"Stream '{name}' not found in router")
 
     def get_stream(self, key: str) -> StreamCaller:
         """Get caller for a specific stream by key."""
-        if key not in self._callers:
+        stream_caller = self._callers.get(key)
+        if stream_caller is None:
             raise RiverError(
                 message=f"Stream '{key}' not found in router",
                 error_type=RiverErrorType.STREAM_NOT_FOUND,
             )
-        return self._callers[key]
+        return stream_caller
 
 
-def create_server_side_caller(router: RiverRouter) -> ServerSideCaller:
+def create_server_side_caller(router: RiverRouter, validation_cache: int = 0) -> ServerSideCaller:
     """
     Create a server-side caller for a router.
 
     Args:
         router: The router containing stream definitions
+        validation_cache: Number of validated inputs to memoize per stream
+            (0 disables; only used for streams with frozen input models)
 
     Returns:
         A caller that can start and resume streams
@@ -145,7 +240,7 @@ def create_server_side_caller(router: RiverRouter) -> ServerSideCaller:
             print(item)
         ```
     """
-    return ServerSideCaller(router)
+    return ServerSideCaller(router, validation_cache=validation_cache)
 
 
 def create_client_side_caller(endpoint: str) -> Any:
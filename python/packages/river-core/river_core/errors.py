@@ -16,6 +16,11 @@ class RiverErrorType(str, Enum):
     NETWORK = "NETWORK"
 
 
+# Plain dict lookup for deserialization; calling the Enum goes through
+# EnumMeta.__call__ on every error chunk
+_ERROR_TYPE_BY_VALUE: dict[str, RiverErrorType] = {t.value: t for t in RiverErrorType}
+
+
 class RiverError(Exception):
     """River error with type and serialization support."""
 
@@ -40,10 +45,10 @@ class RiverError(Exception):
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "RiverError":
-        """Deserialize from dictionary."""
+        """Deserialize from dictionary. Unrecognized error types map to UNKNOWN."""
         return cls(
             message=data["message"],
-            error_type=RiverErrorType(data["error_type"]),
+            error_type=_ERROR_TYPE_BY_VALUE.get(data["error_type"], RiverErrorType.UNKNOWN),
             details=data.get("details", {}),
         )
 
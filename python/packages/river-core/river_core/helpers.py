@@ -1,28 +1,54 @@
 """Helper utilities for River."""
 
-import base64
-import json
+from typing import Any, Callable
 from .types import ResumptionToken
 
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[bytes], Any]
+
+try:
+    # orjson serializes straight to compact UTF-8 bytes
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+try:
+    # SIMD-accelerated codec; the stdlib functions are the fallback
+    from pybase64 import urlsafe_b64decode, urlsafe_b64encode  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on installed extras
+    from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+# Maps the standard base64 alphabet onto the URL-safe one, so tokens issued
+# in the standard alphabet still decode
+_TO_URLSAFE = str.maketrans("+/", "-_")
+
 
 def encode_resumption_token(token: ResumptionToken) -> str:
     """
-    Encode a resumption token to base64 string.
+    Encode a resumption token to a URL-safe base64 string.
 
     Args:
         token: The resumption token to encode
 
     Returns:
-        Base64-encoded JSON string
+        Unpadded URL-safe base64 of the compact JSON token, safe to use
+        in query strings as-is
     """
-    json_str = json.dumps(token)
-    return base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
+    return str(urlsafe_b64encode(_dumps(token)).rstrip(b"=").decode("ascii"))
 
 
 def decode_resumption_token(encoded: str) -> ResumptionToken:
     """
     Decode a resumption token from base64 string.
 
+    Accepts unpadded URL-safe tokens as well as tokens in the standard
+    base64 alphabet.
+
     Args:
         encoded: Base64-encoded token string
 
@@ -30,11 +56,12 @@ def decode_resumption_token(encoded: str) -> ResumptionToken:
         Decoded resumption token
 
     Raises:
-        ValueError: If token is invalid
+        ValueError: If token is invalid; the underlying error is chained
+            as its ``__cause__``
     """
     try:
-        json_str = base64.b64decode(encoded).decode("utf-8")
-        data = json.loads(json_str)
+        padded = encoded.translate(_TO_URLSAFE) + "=" * (-len(encoded) % 4)
+        data = _loads(urlsafe_b64decode(padded))
         return ResumptionToken(**data)  # type: ignore
     except Exception as e:
-        raise ValueError(f"Invalid resumption token: {e}")
+        raise ValueError("Invalid resumption token") from e
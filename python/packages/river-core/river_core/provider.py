@@ -2,46 +2,163 @@
 
 from typing import Any, Callable, AsyncIterator
 import asyncio
+import contextlib
 import time
-import uuid
+import os
 from .types import (
     RiverProvider,
     StreamContext,
     CallerStreamItem,
     ResumptionToken,
     StreamHelper,
-    RiverSpecialChunk,
+    StreamFatalErrorChunk,
 )
 from .errors import RiverError, RiverErrorType
 
 
+# Queue entries are (tag, value) tuples; the public item dicts are only
+# built by the consumer as it yields
+_CHUNK = 0  # value is a chunk
+_SPECIAL = 1  # value is a special chunk
+_LAST = 2  # value is a special chunk that ends the stream
+_END = 3  # end of stream, no value
+_BATCH = 4  # value is a list of chunks
+_END_ENTRY = (_END, None)
+
+_QueueEntry = tuple[int, Any]
+
+
+def _runner_failed(error: Exception) -> StreamFatalErrorChunk:
+    """
+    Build the fatal-error special chunk for an exception raised by a runner.
+
+    The serialized RiverError is built directly rather than via a throwaway
+    exception instance.
+    """
+    return {
+        "type": "stream_fatal_error",
+        "error": {
+            "message": str(error),
+            "error_type": RiverErrorType.RUNNER_ERROR.value,
+            "details": {},
+        },
+    }
+
+
 class DefaultStreamHelper(StreamHelper[Any]):
-    """Default implementation of StreamHelper."""
+    """
+    Default implementation of StreamHelper.
+
+    Items are handed to the consumer through a queue. While the queue has
+    room, appending uses put_nowait and never suspends; once a bounded queue
+    is full, appending waits for the consumer to catch up.
 
-    def __init__(self, queue: asyncio.Queue[CallerStreamItem[Any]]):
+    With ``batch_size`` > 1, chunks are buffered and handed over as one
+    queue entry once ``batch_size`` chunks are buffered or
+    ``flush_interval_ms`` after the first buffered chunk, so the consumer
+    wakes once per batch instead of once per chunk. The consumer still
+    yields every chunk as its own item, in order. If the queue is full when
+    the interval expires, the batch is handed over as soon as the consumer
+    takes an entry, or by the runner's next append or flush if that comes
+    first.
+    """
+
+    __slots__ = (
+        "_queue",
+        "chunk_count",
+        "_batch_size",
+        "_flush_interval",
+        "_batch",
+        "_timer",
+        "_flush_due",
+    )
+
+    def __init__(
+        self,
+        queue: asyncio.Queue[_QueueEntry],
+        batch_size: int = 1,
+        flush_interval_ms: float = 0,
+    ):
         self._queue = queue
+        self.chunk_count = 0
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._batch: list[Any] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Set when the interval expired while the queue was full
+        self._flush_due = False
+
+    def _on_timer(self) -> None:
+        """Hand over a partial batch when its flush interval expires."""
+        self._timer = None
+        if not self._batch:
+            return
+        if self._queue.full():
+            # No room; the consumer hands the batch over once it has taken
+            # an entry, or the next append or flush waits for it
+            self._flush_due = True
+            return
+        self._queue.put_nowait((_BATCH, self._batch))
+        self._batch = []
+
+    def hand_over_due(self) -> None:
+        """
+        Hand over a batch whose flush interval expired while the queue was
+        full, now that the consumer has made room.
+
+        Called by the consumer, so buffered chunks of a runner that has gone
+        idle are not held back until its next append.
+        """
+        if self._flush_due and not self._queue.full():
+            self._flush_due = False
+            if self._batch:
+                self._queue.put_nowait((_BATCH, self._batch))
+                self._batch = []
+
+    def cancel_timer(self) -> None:
+        """Cancel a pending flush timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def flush(self) -> None:
+        """Hand any buffered chunks to the consumer as one batch."""
+        self.cancel_timer()
+        self._flush_due = False
+        if self._batch:
+            batch, self._batch = self._batch, []
+            await self._queue.put((_BATCH, batch))
 
     async def append_chunk(self, chunk: Any) -> None:
         """Append a chunk to the stream."""
-        await self._queue.put({"type": "chunk", "chunk": chunk})
+        self.chunk_count += 1
+        if self._batch_size <= 1:
+            queue = self._queue
+            if queue.full():
+                await queue.put((_CHUNK, chunk))
+            else:
+                queue.put_nowait((_CHUNK, chunk))
+            return
+
+        self._batch.append(chunk)
+        if self._flush_due or len(self._batch) >= self._batch_size:
+            await self.flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self._flush_interval, self._on_timer)
 
     async def append_error(self, error: RiverError) -> None:
         """Append a recoverable error to the stream."""
-        special: RiverSpecialChunk = {
-            "type": "stream_error",
-            "error": error.to_dict(),
-        }
-        await self._queue.put({"type": "special", "special": special})
+        await self.flush()
+        await self._queue.put((_SPECIAL, {"type": "stream_error", "error": error.to_dict()}))
 
     async def send_fatal_error_and_close(self, error: RiverError) -> None:
         """Send a fatal error and close the stream."""
-        special: RiverSpecialChunk = {
-            "type": "stream_fatal_error",
-            "error": error.to_dict(),
-        }
-        await self._queue.put({"type": "special", "special": special})
-        # Signal end of stream
-        await self._queue.put(None)  # type: ignore
+        await self.flush()
+        # A single entry both delivers the error and ends the stream
+        await self._queue.put(
+            (_LAST, {"type": "stream_fatal_error", "error": error.to_dict()})
+        )
 
     async def close(self) -> None:
         """Close the stream successfully."""
@@ -49,6 +166,49 @@ class DefaultStreamHelper(StreamHelper[Any]):
         pass
 
 
+class _InlineStreamHelper(StreamHelper[Any]):
+    """
+    StreamHelper for async generator runners driven inline.
+
+    Items appended through ``ctx.stream`` are buffered and yielded by the
+    provider before the generator's next value.
+    """
+
+    __slots__ = ("items", "chunk_count", "closed")
+
+    def __init__(self) -> None:
+        self.items: list[CallerStreamItem[Any]] = []
+        self.chunk_count = 0
+        # Set once a fatal error has ended the stream
+        self.closed = False
+
+    async def append_chunk(self, chunk: Any) -> None:
+        """Append a chunk to the stream."""
+        self.chunk_count += 1
+        self.items.append({"type": "chunk", "chunk": chunk})
+
+    async def append_error(self, error: RiverError) -> None:
+        """Append a recoverable error to the stream."""
+        self.items.append(
+            {"type": "special", "special": {"type": "stream_error", "error": error.to_dict()}}
+        )
+
+    async def send_fatal_error_and_close(self, error: RiverError) -> None:
+        """Send a fatal error and close the stream."""
+        self.items.append(
+            {
+                "type": "special",
+                "special": {"type": "stream_fatal_error", "error": error.to_dict()},
+            }
+        )
+        self.closed = True
+
+    async def close(self) -> None:
+        """Close the stream successfully."""
+        # The stream ends when the generator returns
+        pass
+
+
 class DefaultRiverProvider:
     """
     Default non-resumable provider.
@@ -58,72 +218,163 @@ class DefaultRiverProvider:
 
     provider_id: str = "default"
     is_resumable: bool = False
+    # Async generator runners are driven inline (see start_stream)
+    supports_generator_runners: bool = True
+
+    def __init__(
+        self,
+        batch_size: int = 1,
+        flush_interval_ms: float = 0,
+        buffer_size: int | None = None,
+    ):
+        """
+        Create the provider.
+
+        Args:
+            batch_size: Hand chunks to the consumer in batches of up to this
+                many (1 disables batching)
+            flush_interval_ms: Hand over a partial batch at most this long
+                after its first chunk (0 flushes on the next event loop
+                iteration)
+            buffer_size: Maximum number of queue entries (chunks, or batches
+                when batching) buffered between the runner and the consumer.
+                Once reached, the runner's appends wait for the consumer, which
+                caps memory for fast runners and slow clients at some cost in
+                throughput. None leaves the buffer unbounded.
+        """
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.buffer_size = buffer_size
 
     async def start_stream(
         self,
         stream_storage_id: str,
         runner: Callable[[StreamContext[Any, Any, Any]], Any],
         context: StreamContext[Any, Any, Any],
+        runner_is_generator: bool = False,
     ) -> AsyncIterator[CallerStreamItem[Any]]:
-        """Start a new stream."""
-        queue: asyncio.Queue[CallerStreamItem[Any] | None] = asyncio.Queue()
-        stream_run_id = str(uuid.uuid4())
-        start_time = time.time()
-        chunk_count = 0
+        """
+        Start a new stream.
 
-        # Create stream helper
-        helper = DefaultStreamHelper(queue)
-        context.stream = helper
+        With ``runner_is_generator``, the runner is an async generator
+        function driven inline: each value it yields becomes a chunk, without
+        a background task or queue. Such runners end the stream by returning
+        and fail it by raising; ``ctx.stream`` still works, and what it
+        appends is streamed before the next yielded value.
+        """
+        stream_run_id = os.urandom(16).hex()
+        # Monotonic clock: stream duration must not jump with wall-clock changes
+        start_ns = time.monotonic_ns()
 
         # Send stream start
-        start_chunk: RiverSpecialChunk = {
-            "type": "stream_start",
-            "stream_run_id": stream_run_id,
+        yield {
+            "type": "special",
+            "special": {"type": "stream_start", "stream_run_id": stream_run_id},
         }
-        yield {"type": "special", "special": start_chunk}
+
+        if runner_is_generator:
+            inline = _InlineStreamHelper()
+            context.stream = inline
+            failure = None
+            run = None
+            try:
+                run = runner(context)
+                async for chunk in run:
+                    # Items appended through ctx.stream precede this value
+                    if inline.items:
+                        items, inline.items = inline.items, []
+                        for item in items:
+                            yield item
+                        if inline.closed:
+                            return
+                    inline.chunk_count += 1
+                    yield {"type": "chunk", "chunk": chunk}
+            except Exception as e:
+                failure = _runner_failed(e)
+            finally:
+                if run is not None:
+                    await run.aclose()
+
+            for item in inline.items:
+                yield item
+            if inline.closed:
+                return
+            if failure is not None:
+                yield {"type": "special", "special": failure}
+                return
+
+            yield {
+                "type": "special",
+                "special": {
+                    "type": "stream_end",
+                    "total_chunks": inline.chunk_count,
+                    "total_time_ms": (time.monotonic_ns() - start_ns) / 1_000_000,
+                },
+            }
+            return
+
+        try:
+            run = runner(context)
+        except Exception as e:
+            yield {"type": "special", "special": _runner_failed(e)}
+            return
+
+        queue: asyncio.Queue[_QueueEntry] = asyncio.Queue(maxsize=self.buffer_size or 0)
+
+        # Create stream helper
+        helper = DefaultStreamHelper(
+            queue, batch_size=self.batch_size, flush_interval_ms=self.flush_interval_ms
+        )
+        context.stream = helper
 
         # Run the stream in background
         async def run_stream() -> None:
             try:
-                await runner(context)
+                await run
 
-                # Send stream end
-                end_time = time.time()
-                end_chunk: RiverSpecialChunk = {
-                    "type": "stream_end",
-                    "total_chunks": chunk_count,
-                    "total_time_ms": (end_time - start_time) * 1000,
-                }
-                await queue.put({"type": "special", "special": end_chunk})
-            except Exception as e:
-                # Send fatal error
-                error = RiverError(
-                    message=str(e),
-                    error_type=RiverErrorType.RUNNER_ERROR,
+                # Send stream end after any buffered chunks
+                await helper.flush()
+                await queue.put(
+                    (
+                        _LAST,
+                        {
+                            "type": "stream_end",
+                            "total_chunks": helper.chunk_count,
+                            "total_time_ms": (time.monotonic_ns() - start_ns) / 1_000_000,
+                        },
+                    )
                 )
-                fatal_chunk: RiverSpecialChunk = {
-                    "type": "stream_fatal_error",
-                    "error": error.to_dict(),
-                }
-                await queue.put({"type": "special", "special": fatal_chunk})
+            except Exception as e:
+                await helper.flush()
+                await queue.put((_LAST, _runner_failed(e)))
             finally:
-                await queue.put(None)  # Signal completion
+                # Signal completion; a full queue means the consumer has
+                # already stopped reading
+                with contextlib.suppress(asyncio.QueueFull):
+                    queue.put_nowait(_END_ENTRY)
 
         # Start runner task
         runner_task = asyncio.create_task(run_stream())
 
-        # Yield chunks from queue
+        # Yield chunks from queue, only suspending when it is empty. Item dicts
+        # are dict displays at the yield site: CPython builds these as fast as
+        # it copies a prebuilt template, and only yielded items pay for one
         try:
             while True:
-                item = await queue.get()
-                if item is None:
+                tag, value = queue.get_nowait() if queue.qsize() else await queue.get()
+                if helper._flush_due:
+                    helper.hand_over_due()
+                if tag == _CHUNK:
+                    yield {"type": "chunk", "chunk": value}
+                elif tag == _BATCH:
+                    for chunk in value:
+                        yield {"type": "chunk", "chunk": chunk}
+                elif tag == _SPECIAL:
+                    yield {"type": "special", "special": value}
+                else:
+                    if tag == _LAST:
+                        yield {"type": "special", "special": value}
                     break
-
-                # Count regular chunks
-                if item["type"] == "chunk":
-                    chunk_count += 1
-
-                yield item
         finally:
             # Ensure task completes
             if not runner_task.done():
@@ -132,6 +383,7 @@ class DefaultRiverProvider:
                     await runner_task
                 except asyncio.CancelledError:
                     pass
+            helper.cancel_timer()
 
     async def resume_stream(
         self, resumption_token: ResumptionToken
@@ -143,6 +395,27 @@ class DefaultRiverProvider:
         )
 
 
-def default_river_provider() -> DefaultRiverProvider:
-    """Create the default non-resumable provider."""
-    return DefaultRiverProvider()
+def default_river_provider(
+    batch_size: int = 1,
+    flush_interval_ms: float = 0,
+    buffer_size: int | None = None,
+) -> DefaultRiverProvider:
+    """
+    Create the default non-resumable provider.
+
+    Args:
+        batch_size: Hand chunks to the consumer in batches of up to this many
+            (1 disables batching)
+        flush_interval_ms: Hand over a partial batch at most this long after
+            its first chunk
+        buffer_size: Maximum number of queue entries buffered between the
+            runner and the consumer before appends wait (None for unbounded)
+
+    Returns:
+        A DefaultRiverProvider
+    """
+    return DefaultRiverProvider(
+        batch_size=batch_size,
+        flush_interval_ms=flush_interval_ms,
+        buffer_size=buffer_size,
+    )
@@ -1,10 +1,10 @@
 """Router implementation."""
 
-from typing import Any
+from typing import Any, Mapping
 from .types import RiverRouter, RiverStream
 
 
-def create_river_router(streams: dict[str, RiverStream[Any, Any, Any]]) -> RiverRouter:
+def create_river_router(streams: Mapping[str, RiverStream[Any, Any, Any]]) -> RiverRouter:
     """
     Create a router from a collection of streams.
 
@@ -12,7 +12,8 @@ def create_river_router(streams: dict[str, RiverStream[Any, Any, Any]]) -> River
         streams: Dictionary mapping stream names to stream definitions
 
     Returns:
-        A RiverRouter that can be used with adapters and callers
+        A RiverRouter that can be used with adapters and callers. The
+        router holds its own copy of ``streams``.
 
     Example:
         ```python
@@ -3,6 +3,8 @@
 from typing import TypeVar, Generic, Callable, Any, cast
 from pydantic import BaseModel
 from .types import RiverStream, RiverProvider, StreamContext
+from .batching import batched_runner
+import inspect
 import uuid
 
 InputT = TypeVar("InputT", bound=BaseModel)
@@ -10,6 +12,18 @@ ChunkT = TypeVar("ChunkT")
 AdapterRequestT = TypeVar("AdapterRequestT")
 
 
+def _generator_runner(
+    runner_fn: Callable[[StreamContext[Any, Any, Any]], Any],
+) -> Callable[[StreamContext[Any, Any, Any]], Any]:
+    """Adapt an async generator runner to append its values via ctx.stream."""
+
+    async def run(context: StreamContext[Any, Any, Any]) -> None:
+        async for chunk in runner_fn(context):
+            await context.stream.append_chunk(chunk)
+
+    return run
+
+
 class StreamBuilderStep1(Generic[ChunkT]):
     """First step: define input schema."""
 
@@ -46,6 +60,24 @@ class StreamBuilderStep3(Generic[InputT, ChunkT]):
     ):
         self._input_model = input_model
         self._provider = provider
+        self._batching: tuple[int, float] | None = None
+
+    def batching(
+        self, max_bytes: int = 512, max_delay_ms: float = 20
+    ) -> "StreamBuilderStep3[InputT, ChunkT]":
+        """
+        Coalesce small string chunks before they reach the provider.
+
+        Chunks are flushed once ``max_bytes`` are buffered or ``max_delay_ms``
+        after the first buffered chunk, trading a bounded delay for fewer
+        provider writes and SSE frames.
+
+        Args:
+            max_bytes: Flush once this many UTF-8 bytes are buffered
+            max_delay_ms: Maximum time a chunk may wait in the buffer
+        """
+        self._batching = (max_bytes, max_delay_ms)
+        return self
 
     def runner(
         self,
@@ -55,17 +87,36 @@ class StreamBuilderStep3(Generic[InputT, ChunkT]):
         """
         Define the stream execution logic.
 
+        The runner is either an async function that writes to ``ctx.stream``,
+        or an async generator function whose yielded values are the stream's
+        chunks. Providers that support generator runners drive them inline;
+        for all others they are adapted to append through ``ctx.stream``.
+
         Args:
-            runner_fn: Async function that implements the stream logic
+            runner_fn: Async function or async generator function that
+                implements the stream logic
             stream_storage_id: Optional custom storage ID (auto-generated if not provided)
         """
         storage_id = stream_storage_id or str(uuid.uuid4())
 
+        runner_is_generator = inspect.isasyncgenfunction(runner_fn)
+        if runner_is_generator and (
+            self._batching is not None
+            or not getattr(self._provider, "supports_generator_runners", False)
+        ):
+            runner_fn = _generator_runner(runner_fn)
+            runner_is_generator = False
+
+        if self._batching is not None:
+            max_bytes, max_delay_ms = self._batching
+            runner_fn = batched_runner(runner_fn, max_bytes, max_delay_ms)
+
         return RiverStream(
             input_model=self._input_model,
             provider=self._provider,
             runner=runner_fn,
             stream_storage_id=storage_id,
+            runner_is_generator=runner_is_generator,
         )
 
 
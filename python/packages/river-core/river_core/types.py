@@ -33,6 +33,8 @@ class ResumptionToken(TypedDict):
 class StreamHelper(Generic[ChunkT]):
     """Helper methods available in the stream runner."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def append_chunk(self, chunk: ChunkT) -> None:
         """Append a chunk to the stream."""
@@ -57,6 +59,8 @@ class StreamHelper(Generic[ChunkT]):
 class StreamContext(Generic[InputT, ChunkT, AdapterRequestT]):
     """Context provided to stream runner."""
 
+    __slots__ = ("input", "stream", "adapter_request", "abort_signal")
+
     input: InputT
     stream: StreamHelper[ChunkT]
     adapter_request: AdapterRequestT
@@ -66,18 +70,16 @@ class StreamContext(Generic[InputT, ChunkT, AdapterRequestT]):
 class AbortSignal:
     """Signal to abort stream execution."""
 
+    __slots__ = ("aborted", "_callbacks")
+
     def __init__(self) -> None:
-        self._aborted = False
+        # Plain slot rather than a property: callers check it once per item
+        self.aborted = False
         self._callbacks: list[Callable[[], None]] = []
 
-    @property
-    def aborted(self) -> bool:
-        """Check if stream has been aborted."""
-        return self._aborted
-
     def abort(self) -> None:
         """Abort the stream."""
-        self._aborted = True
+        self.aborted = True
         for callback in self._callbacks:
             callback()
 
@@ -164,8 +166,14 @@ class RiverProvider(Protocol[ChunkT]):
         stream_storage_id: str,
         runner: Callable[[StreamContext[Any, ChunkT, Any]], Any],
         context: StreamContext[Any, ChunkT, Any],
+        runner_is_generator: bool = False,
     ) -> AsyncIterator[CallerStreamItem[ChunkT]]:
-        """Start a new stream."""
+        """
+        Start a new stream.
+
+        ``runner_is_generator`` is only ever True for providers that set
+        ``supports_generator_runners``; see RiverStream.runner_is_generator.
+        """
         ...
 
     async def resume_stream(
@@ -178,17 +186,23 @@ class RiverProvider(Protocol[ChunkT]):
 class RiverStream(Generic[InputT, ChunkT, AdapterRequestT]):
     """A River stream definition."""
 
+    __slots__ = ("input_model", "provider", "runner", "stream_storage_id", "runner_is_generator")
+
     def __init__(
         self,
         input_model: type[InputT],
         provider: RiverProvider[ChunkT],
         runner: Callable[[StreamContext[InputT, ChunkT, AdapterRequestT]], Any],
         stream_storage_id: str,
+        runner_is_generator: bool = False,
     ):
         self.input_model = input_model
         self.provider = provider
         self.runner = runner
         self.stream_storage_id = stream_storage_id
+        # True when runner is an async generator function handed to the
+        # provider as-is; its yielded values are the stream's chunks
+        self.runner_is_generator = runner_is_generator
 
 
 class RiverRouter(dict[str, RiverStream[Any, Any, Any]]):
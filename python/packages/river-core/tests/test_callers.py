@@ -1,5 +1,6 @@
 """Tests for server-side callers."""
 
+import inspect
 import pytest
 from pydantic import BaseModel, ValidationError
 from river_core import (
@@ -84,3 +85,148 @@ async def test_server_caller_stream_not_found():
         caller.get_stream("nonexistent")
 
     assert "not found" in str(exc_info.value).lower()
+
+
+def test_server_caller_stream_attributes():
+    """Test that streams are bound as caller attributes."""
+
+    async def test_runner(ctx):
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .runner(test_runner)
+    )
+
+    router = create_river_router({"test": stream, "get_stream": stream})
+    caller = create_server_side_caller(router)
+
+    assert caller.test is caller.get_stream("test")
+    # Keys that collide with caller methods don't shadow them
+    assert callable(caller.get_stream)
+    assert caller.get_stream("get_stream") is not caller.test
+
+    with pytest.raises(AttributeError):
+        caller.nonexistent
+
+
+class FrozenInput(BaseModel):
+    """Frozen test input model."""
+
+    model_config = {"frozen": True}
+
+    value: int
+
+
+@pytest.mark.asyncio
+async def test_server_caller_validation_cache():
+    """Test that validated inputs are memoized for frozen input models."""
+
+    inputs = []
+
+    async def test_runner(ctx):
+        inputs.append(ctx.input)
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(FrozenInput)
+        .provider(default_river_provider())
+        .runner(test_runner)
+    )
+
+    caller = create_server_side_caller(
+        create_river_router({"test": stream}), validation_cache=8
+    )
+
+    for input_data in ({"value": 1}, {"value": 1}, {"value": True}):
+        async for _ in caller.test.start(input_data=input_data, adapter_request=None):
+            pass
+
+    assert inputs[0] is inputs[1]
+    assert inputs[2] is not inputs[0]
+
+    with pytest.raises(RiverError):
+        async for _ in caller.test.start(input_data={"value": "x"}, adapter_request=None):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_server_caller_generator_runner_stream_helper():
+    """Test that generator runners can also write through ctx.stream."""
+
+    async def test_runner(ctx):
+        yield ctx.input.value
+        await ctx.stream.append_error(RiverError(message="skipped"))
+        await ctx.stream.append_chunk(ctx.input.value + 1)
+        yield ctx.input.value + 2
+
+    async def fatal_runner(ctx):
+        yield ctx.input.value
+        await ctx.stream.send_fatal_error_and_close(RiverError(message="fatal"))
+        yield ctx.input.value + 1
+
+    for runner, expected in (
+        (test_runner, [5, "stream_error", 6, 7, "stream_end"]),
+        (fatal_runner, [5, "stream_fatal_error"]),
+    ):
+        stream = (
+            create_river_stream()
+            .input_schema(TestInput)
+            .provider(default_river_provider())
+            .runner(runner)
+        )
+        assert stream.runner_is_generator
+
+        router = create_river_router({"test": stream})
+        caller = create_server_side_caller(router)
+
+        items = []
+        async for item in caller.test.start(
+            input_data={"value": 5},
+            adapter_request=None,
+        ):
+            if item["type"] == "chunk":
+                items.append(item["chunk"])
+            elif item["special"]["type"] != "stream_start":
+                items.append(item["special"]["type"])
+                if item["special"]["type"] == "stream_end":
+                    assert item["special"]["total_chunks"] == 3
+
+        assert items == expected
+
+
+@pytest.mark.asyncio
+async def test_server_caller_prepare_validates_eagerly():
+    """Test that prepare() validates up front while start() stays lazy."""
+
+    async def test_runner(ctx):
+        await ctx.stream.append_chunk(ctx.input.value)
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .runner(test_runner)
+    )
+    caller = create_server_side_caller(create_river_router({"test": stream}))
+
+    assert inspect.isasyncgenfunction(type(caller.test).start)
+
+    with pytest.raises(RiverError):
+        caller.test.prepare(input_data={"value": "not_an_int"}, adapter_request=None)
+
+    # start() only raises once iterated
+    items = caller.test.start(input_data={"value": "not_an_int"}, adapter_request=None)
+    with pytest.raises(RiverError):
+        await items.__anext__()
+
+    chunks = [
+        item["chunk"]
+        async for item in caller.test.prepare(input_data={"value": 3}, adapter_request=None)
+        if item["type"] == "chunk"
+    ]
+    assert chunks == [3]
@@ -32,6 +32,18 @@ def test_river_error_serialization():
     assert serialized["details"]["key"] == "value"
 
 
+def test_river_error_to_dict_reflects_changes():
+    """Test that to_dict returns a new dict reflecting the current error."""
+    error = RiverError("Test error", RiverErrorType.PROVIDER)
+
+    serialized = error.to_dict()
+    serialized["message"] = "Modified"
+    assert error.to_dict()["message"] == "Test error"
+
+    error.message = "Changed"
+    assert error.to_dict()["message"] == "Changed"
+
+
 def test_river_error_deserialization():
     """Test error deserialization."""
     data = {
@@ -47,6 +59,14 @@ def test_river_error_deserialization():
     assert error.details["info"] == "test"
 
 
+def test_river_error_deserialization_unknown_type():
+    """Test unrecognized error types deserialize as UNKNOWN."""
+    error = RiverError.from_dict({"message": "Test error", "error_type": "NOT_A_TYPE"})
+
+    assert error.error_type == RiverErrorType.UNKNOWN
+    assert error.details == {}
+
+
 def test_river_error_types():
     """Test all error types are defined."""
     types = [
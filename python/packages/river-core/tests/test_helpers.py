@@ -0,0 +1,43 @@
+"""Tests for River helper utilities."""
+
+import base64
+import json
+import pytest
+from river_core.helpers import encode_resumption_token, decode_resumption_token
+from river_core.types import ResumptionToken
+
+
+def make_token() -> ResumptionToken:
+    return ResumptionToken(
+        provider_id="redis",
+        router_stream_key="chat",
+        stream_storage_id="storage?id",
+        stream_run_id="run>id",
+    )
+
+
+def test_resumption_token_round_trip():
+    """Test encoding and decoding a resumption token."""
+    token = make_token()
+
+    encoded = encode_resumption_token(token)
+
+    assert decode_resumption_token(encoded) == token
+    # URL-safe alphabet without padding, usable in query strings as-is
+    assert not set(encoded) & set("+/=")
+
+
+def test_decode_standard_base64_token():
+    """Test that tokens in the standard base64 alphabet still decode."""
+    token = make_token()
+    encoded = base64.b64encode(json.dumps(token).encode("utf-8")).decode("utf-8")
+
+    assert decode_resumption_token(encoded) == token
+
+
+def test_decode_invalid_resumption_token():
+    """Test that invalid tokens raise ValueError."""
+    with pytest.raises(ValueError) as exc_info:
+        decode_resumption_token("not a token")
+
+    assert "invalid resumption token" in str(exc_info.value).lower()
@@ -63,3 +63,29 @@ async def test_router_stream_access():
     assert router["test"] == stream
     assert router.get("test") == stream
     assert router.get("nonexistent") is None
+
+
+@pytest.mark.asyncio
+async def test_router_is_a_dict():
+    """Test that routers are dicts holding their own copy of the streams."""
+
+    async def test_runner(ctx):
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .runner(test_runner)
+    )
+
+    streams = {"test": stream}
+    router = create_river_router(streams)
+    streams["other"] = stream
+
+    assert isinstance(router, dict)
+    assert "other" not in router
+
+    router["other"] = stream
+    router.update({"third": stream})
+    assert list(router) == ["test", "other", "third"]
@@ -1,8 +1,12 @@
 """Tests for River stream creation and execution."""
 
+import asyncio
 import pytest
 from pydantic import BaseModel
 from river_core import create_river_stream, default_river_provider
+from river_core.batching import BatchingStreamHelper
+from river_core.errors import RiverError, RiverErrorType
+from river_core.provider import DefaultStreamHelper
 from river_core.types import StreamContext
 
 
@@ -100,3 +104,389 @@ async def test_stream_special_chunks():
     assert special_chunks[1]["type"] == "stream_end"
     assert "stream_run_id" in special_chunks[0]
     assert "total_chunks" in special_chunks[1]
+    assert special_chunks[1]["total_chunks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_fatal_error_ends_stream():
+    """Test that a fatal error is the last item of the stream."""
+
+    items = []
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("data")
+        await ctx.stream.send_fatal_error_and_close(
+            RiverError("boom", RiverErrorType.RUNNER_ERROR)
+        )
+        await ctx.stream.append_chunk("ignored")
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    async for item in stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        items.append(item)
+
+    assert [item["type"] for item in items] == ["special", "chunk", "special"]
+    assert items[-1]["special"]["type"] == "stream_fatal_error"
+    assert items[-1]["special"]["error"]["message"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_provider_chunk_batches():
+    """Test that provider-level batching keeps every chunk and its order."""
+
+    items = []
+
+    async def test_runner(ctx: StreamContext):
+        for i in range(5):
+            await ctx.stream.append_chunk(i)
+        await ctx.stream.append_error(RiverError("oops", RiverErrorType.RUNNER_ERROR))
+        await ctx.stream.append_chunk(5)
+        await asyncio.sleep(0.05)
+        await ctx.stream.append_chunk(6)
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider(batch_size=2, flush_interval_ms=10))
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    async for item in stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "chunk":
+            items.append(item["chunk"])
+        else:
+            items.append(item["special"]["type"])
+
+    assert items == ["stream_start", 0, 1, 2, 3, 4, "stream_error", 5, 6, "stream_end"]
+
+
+@pytest.mark.asyncio
+async def test_provider_buffer_size_backpressure():
+    """Test that a bounded buffer keeps the runner close to the consumer."""
+
+    produced = 0
+    chunks = []
+
+    async def test_runner(ctx: StreamContext):
+        nonlocal produced
+        for i in range(10):
+            await ctx.stream.append_chunk(i)
+            produced += 1
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider(buffer_size=2))
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    async for item in stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "chunk":
+            chunks.append(item["chunk"])
+            # At most the buffered entries plus the one being handed over
+            assert produced - len(chunks) <= 3
+            await asyncio.sleep(0)
+
+    assert chunks == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_provider_batches_with_full_buffer(monkeypatch):
+    """Test that a batch due while the buffer is full waits without spinning."""
+
+    timer_calls = 0
+    on_timer = DefaultStreamHelper._on_timer
+
+    def counting_on_timer(self):
+        nonlocal timer_calls
+        timer_calls += 1
+        on_timer(self)
+
+    monkeypatch.setattr(DefaultStreamHelper, "_on_timer", counting_on_timer)
+    release = asyncio.Event()
+
+    async def test_runner(ctx: StreamContext):
+        for i in range(4):
+            await ctx.stream.append_chunk(i)
+            await asyncio.sleep(0.01)
+        await release.wait()
+        await ctx.stream.append_chunk(4)
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider(batch_size=4, flush_interval_ms=0, buffer_size=1))
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    gen = stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    )
+    chunks = []
+    await gen.__anext__()  # stream_start
+    chunks.append((await gen.__anext__())["chunk"])
+
+    # Stalled consumer: the buffer fills and partial batches become due
+    await asyncio.sleep(0.1)
+    assert timer_calls < 10
+
+    release.set()
+    async for item in gen:
+        if item["type"] == "chunk":
+            chunks.append(item["chunk"])
+
+    assert chunks == list(range(5))
+    assert context.stream._timer is None
+
+
+@pytest.mark.asyncio
+async def test_generator_runner():
+    """Test that async generator runners stream their yielded values."""
+
+    async def test_runner(ctx: StreamContext):
+        for i in range(3):
+            yield i
+
+    async def failing_runner(ctx: StreamContext):
+        yield "data"
+        raise ValueError("boom")
+
+    for runner, expected in (
+        (test_runner, [0, 1, 2, "stream_end"]),
+        (failing_runner, ["data", "stream_fatal_error"]),
+    ):
+        stream = (
+            create_river_stream()
+            .input_schema(TestInput)
+            .provider(default_river_provider())
+            .runner(runner)
+        )
+        assert stream.runner_is_generator
+
+        context = StreamContext()
+        context.input = TestInput(message="test")
+
+        items = []
+        async for item in stream.provider.start_stream(
+            stream_storage_id=stream.stream_storage_id,
+            runner=stream.runner,
+            context=context,
+            runner_is_generator=stream.runner_is_generator,
+        ):
+            if item["type"] == "chunk":
+                items.append(item["chunk"])
+            elif item["special"]["type"] != "stream_start":
+                items.append(item["special"]["type"])
+
+        assert items == expected
+
+
+@pytest.mark.asyncio
+async def test_generator_runner_with_batching():
+    """Test that generator runners are adapted when batching is enabled."""
+
+    async def test_runner(ctx: StreamContext):
+        for word in ["a", "b", "c"]:
+            yield word
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .batching(max_bytes=512, max_delay_ms=20)
+        .runner(test_runner)
+    )
+    assert not stream.runner_is_generator
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    chunks = []
+    async for item in stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "chunk":
+            chunks.append(item["chunk"])
+
+    assert chunks == ["abc"]
+
+
+@pytest.mark.asyncio
+async def test_stream_batching():
+    """Test that batching coalesces small string chunks."""
+
+    chunks = []
+
+    async def test_runner(ctx: StreamContext):
+        for word in ["a", "b", "c"]:
+            await ctx.stream.append_chunk(word)
+        await ctx.stream.append_chunk(42)
+        await ctx.stream.append_chunk("d")
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .batching(max_bytes=512, max_delay_ms=1000)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    async for item in stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "chunk":
+            chunks.append(item["chunk"])
+
+    # Non-string chunks flush the buffer so ordering is preserved
+    assert chunks == ["abc", 42, "d"]
+
+
+@pytest.mark.asyncio
+async def test_stream_batching_flushes_on_size_and_delay():
+    """Test that batches flush when full or when the delay expires."""
+
+    chunks = []
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("xx")
+        await ctx.stream.append_chunk("yy")  # reaches max_bytes
+        await ctx.stream.append_chunk("z")
+        await asyncio.sleep(0.05)  # delay window expires
+        await ctx.stream.append_chunk("w")
+        await ctx.stream.close()
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(default_river_provider())
+        .batching(max_bytes=4, max_delay_ms=10)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    async for item in stream.provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "chunk":
+            chunks.append(item["chunk"])
+
+    assert chunks == ["xxyy", "z", "w"]
+
+
+@pytest.mark.asyncio
+async def test_stream_batching_backpressure():
+    """Test that timer flushes wait for a stalled consumer instead of piling up."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    helper = BatchingStreamHelper(
+        DefaultStreamHelper(queue), max_bytes=512, max_delay_ms=1
+    )
+    appended = []
+
+    async def runner():
+        for i in range(300):
+            await helper.append_chunk(str(i % 10))
+            appended.append(i)
+            await asyncio.sleep(0.001)
+        await helper.close()
+
+    tasks_before = len(asyncio.all_tasks())
+    runner_task = asyncio.create_task(runner())
+
+    # Nobody reads the queue: the runner must block, not spawn flushes
+    await asyncio.sleep(0.2)
+    assert len(asyncio.all_tasks()) - tasks_before <= 2
+    stalled_at = len(appended)
+    await asyncio.sleep(0.05)
+    assert len(appended) == stalled_at < 300
+
+    # Draining the queue lets the runner finish with every chunk in order
+    received = []
+    while not runner_task.done() or not queue.empty():
+        try:
+            _tag, value = await asyncio.wait_for(queue.get(), timeout=0.1)
+        except asyncio.TimeoutError:
+            continue
+        received.extend(value if isinstance(value, list) else [value])
+    await runner_task
+
+    assert "".join(received) == "".join(str(i % 10) for i in range(300))
+
+
+@pytest.mark.asyncio
+async def test_provider_due_batch_reaches_idle_consumer():
+    """Test that a batch due while the buffer was full is not held by an idle runner."""
+    release = asyncio.Event()
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.append_error(RiverError("first"))
+        await ctx.stream.append_error(RiverError("second"))
+        await ctx.stream.append_chunk("a")
+        await ctx.stream.append_chunk("b")
+        # Idle, e.g. waiting on an upstream call
+        await release.wait()
+
+    provider = default_river_provider(batch_size=10, flush_interval_ms=5, buffer_size=1)
+    context = StreamContext()
+    context.input = TestInput(message="test")
+    gen = provider.start_stream(
+        stream_storage_id="test", runner=test_runner, context=context
+    )
+
+    assert (await gen.__anext__())["special"]["type"] == "stream_start"
+    assert (await gen.__anext__())["special"]["type"] == "stream_error"
+    # The flush interval expires while the buffer holds the second error
+    await asyncio.sleep(0.05)
+    assert (await gen.__anext__())["special"]["type"] == "stream_error"
+
+    assert (await asyncio.wait_for(gen.__anext__(), timeout=1))["chunk"] == "a"
+    assert (await gen.__anext__())["chunk"] == "b"
+
+    release.set()
+    remaining = [item async for item in gen]
+    assert remaining[-1]["special"]["type"] == "stream_end"
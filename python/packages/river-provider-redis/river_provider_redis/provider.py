@@ -1,11 +1,16 @@
 """Redis-backed resumable provider implementation."""
 
-from typing import Any, Callable, AsyncIterator
+from typing import Any, Callable, AsyncIterator, cast
 import asyncio
+import functools
+import logging
 import time
-import uuid
-import json
+import os
+import socket
+import orjson
 from redis import asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.typing import EncodableT, FieldT
 from river_core.types import (
     StreamContext,
     CallerStreamItem,
@@ -16,34 +21,264 @@ from river_core.types import (
 from river_core.errors import RiverError, RiverErrorType
 from river_core.helpers import encode_resumption_token
 
+logger = logging.getLogger(__name__)
+
+# Stream entry field names as returned by a client with
+# decode_responses=False
+_DATA_KEY = b"data"
+_END_KEY = b"end"
+
+# Special types after which a resumed stream has no further items
+_TERMINAL_SPECIALS = frozenset(("stream_fatal_error", "stream_end"))
+
+# TCP keepalive probing for pooled connections: first probe after 30s idle,
+# then every 10s, giving up after 3 misses (only the options this platform
+# supports)
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Resume reads: entries fetched per XREAD, and how long each XREAD blocks
+# waiting for new entries
+_XREAD_COUNT = 1000
+_XREAD_BLOCK_MS = 1000
+
+# Fields of a stream entry, as accepted by XADD
+_Fields = dict[FieldT, EncodableT]
+
+# XREAD reply: [(stream key, [(entry id, fields), ...]), ...]
+_XReadReply = list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]
+
+
+def _build_stream_key(
+    key_prefix: bytes, stream_storage_id: str, stream_run_id: str
+) -> bytes:
+    """Build a Redis stream key as bytes."""
+    return b"%s%s:%s" % (key_prefix, stream_storage_id.encode(), stream_run_id.encode())
+
+
+# Memoized for resumption tokens that are resumed repeatedly
+_cached_stream_key = functools.lru_cache(maxsize=1024)(_build_stream_key)
+
+
+def _is_pool_timeout(error: Exception) -> bool:
+    """Whether a command failed only because no pooled connection was free."""
+    return isinstance(error, RedisConnectionError) and isinstance(
+        error.__cause__, asyncio.TimeoutError
+    )
+
 
 class RedisStreamHelper(StreamHelper[Any]):
-    """Redis-backed stream helper that dual-writes to Redis and live stream."""
+    """
+    Redis-backed stream helper that dual-writes to Redis and live stream.
+
+    Items go to the live queue first; if it is bounded and full, appending
+    waits for the live consumer. Their Redis writes go to a background
+    writer through two alternating buffers: appends fill the active buffer
+    while the writer sends the other one to Redis, pipelined in round-trips
+    of up to ``batch_size`` writes, then the two are swapped. Live
+    consumers never wait on Redis. Once ``max_pending_writes`` writes fill
+    the active buffer, appending waits for the next swap. The end marker is
+    always written after every item buffered before it.
+
+    With ``maxlen`` set, each write trims the stream to roughly that many
+    entries. With ``ttl_seconds`` set, the stream key expires that long
+    after the end marker is written.
+
+    String and bytes chunks of at least ``offload_threshold`` characters are
+    serialized in the default executor instead of on the event loop.
+
+    Once the live consumer goes away (``detach_live``), items are only
+    written to Redis, so the runner finishes for later resumes.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_live",
+        "chunk_count",
+        "_dumps",
+        "_redis",
+        "_stream_key",
+        "_batch_size",
+        "_max_pending_writes",
+        "_maxlen",
+        "_ttl_seconds",
+        "_offload_threshold",
+        "_buffers",
+        "_active",
+        "_wake",
+        "_swapped",
+        "_writer_task",
+        "_writes_closed",
+    )
 
     def __init__(
         self,
         queue: asyncio.Queue[CallerStreamItem[Any]],
-        redis_client: aioredis.Redis,  # type: ignore
-        stream_key: str,
+        redis_client: aioredis.Redis,
+        stream_key: bytes,
+        batch_size: int = 32,
+        max_pending_writes: int = 1024,
+        dumps: Callable[[Any], bytes | str] = orjson.dumps,
+        maxlen: int | None = None,
+        ttl_seconds: int | None = None,
+        offload_threshold: int | None = 1_048_576,
     ):
         self._queue = queue
+        self._live = True
+        self.chunk_count = 0
+        self._dumps = dumps
         self._redis = redis_client
         self._stream_key = stream_key
+        self._batch_size = batch_size
+        self._max_pending_writes = max_pending_writes
+        self._maxlen = maxlen
+        self._ttl_seconds = ttl_seconds
+        self._offload_threshold = offload_threshold
+        # Stream entry fields to write: appends go to _buffers[_active],
+        # the writer sends the other one
+        self._buffers: tuple[list[_Fields], ...] = ([], [])
+        self._active = 0
+        self._wake = asyncio.Event()  # Set when the active buffer has entries
+        self._swapped = asyncio.Event()  # Set when the writer takes a buffer
+        self._writer_task: asyncio.Task[None] | None = None
+        self._writes_closed = False
+
+    def start_writer(self) -> None:
+        """Start the background task that writes queued entries to Redis."""
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        """Swap out the active buffer and write it to Redis until closed."""
+        buffers = self._buffers
+        stream_key = self._stream_key
+        batch_size = self._batch_size
+        maxlen = self._maxlen
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+
+            # Take the active buffer; appends continue into the other one
+            pending = buffers[self._active]
+            self._active ^= 1
+            self._swapped.set()
+            # Once closed, the end marker is the last entry taken
+            final = self._writes_closed
+
+            for start in range(0, len(pending), batch_size):
+                # Writes are done after the last batch; expire the key in
+                # the same round-trip
+                ttl = (
+                    self._ttl_seconds
+                    if final and start + batch_size >= len(pending)
+                    else None
+                )
+                while True:
+                    # A pipeline is reset by execute(), so each attempt
+                    # builds its own
+                    pipe = self._redis.pipeline(transaction=False)
+                    for fields in pending[start : start + batch_size]:
+                        # Approximate trimming lets Redis drop whole macro nodes
+                        pipe.xadd(stream_key, fields, maxlen=maxlen, approximate=True)
+                    if ttl is not None:
+                        pipe.expire(stream_key, ttl)
+                    try:
+                        await pipe.execute()
+                    except Exception as e:
+                        if _is_pool_timeout(e):
+                            # Nothing was sent; wait for a connection again
+                            logger.warning("No Redis connection available, retrying write")
+                            continue
+                        # Log error but don't fail the stream
+                        logger.warning("Failed to write to Redis: %s", e)
+                    break
+            pending.clear()
+
+            if final:
+                return
+
+    async def _enqueue_write(self, fields: _Fields) -> None:
+        """Buffer an entry for the writer, waiting only if the buffer is full."""
+        buffer = self._buffers[self._active]
+        buffer.append(fields)
+        self._wake.set()
+        if len(buffer) >= self._max_pending_writes:
+            # Wait for the writer to take this buffer
+            self._swapped.clear()
+            await self._swapped.wait()
+
+    async def _write_to_redis(self, item: CallerStreamItem[Any], size: int = 0) -> None:
+        """
+        Queue an item for writing to the Redis stream.
 
-    async def _write_to_redis(self, item: CallerStreamItem[Any]) -> None:
-        """Write item to Redis stream."""
+        Args:
+            item: The item to persist
+            size: Length of the item's chunk if known (str or bytes); items
+                of at least ``offload_threshold`` are serialized in a thread
+        """
+        if self._writes_closed:
+            return
         try:
-            serialized = json.dumps({"item": item})
-            await self._redis.xadd(self._stream_key, {"data": serialized})
+            if self._offload_threshold is not None and size >= self._offload_threshold:
+                # Keep the event loop free while a large payload is encoded
+                loop = asyncio.get_running_loop()
+                serialized = await loop.run_in_executor(None, self._dumps, item)
+            else:
+                serialized = self._dumps(item)
         except Exception as e:
             # Log error but don't fail the stream
-            print(f"Warning: Failed to write to Redis: {e}")
+            logger.warning("Failed to write to Redis: %s", e)
+            return
+        await self._enqueue_write({"data": serialized})
+
+    async def _write_end_marker(self, item: CallerStreamItem[Any] | None = None) -> None:
+        """
+        Write the end marker and wait until all writes have been sent.
+
+        Args:
+            item: Optional final item (e.g. stream_end) stored in the same
+                entry as the end marker
+        """
+        if self._writes_closed:
+            return
+        self._writes_closed = True
+        fields: _Fields = {"end": "true"}
+        if item is not None:
+            try:
+                fields["data"] = self._dumps(item)
+            except Exception as e:
+                # Log error but still end the stream
+                logger.warning("Failed to write to Redis: %s", e)
+        await self._enqueue_write(fields)
+        if self._writer_task is not None:
+            await self._writer_task
+
+    async def _put_live(self, item: CallerStreamItem[Any] | None) -> None:
+        """Hand an item to the live consumer, unless it has gone away."""
+        if self._live:
+            await self._queue.put(item)
+
+    def detach_live(self) -> None:
+        """
+        Stop feeding the live queue once its consumer has gone away.
+
+        The queue is drained so a producer blocked on it is released.
+        """
+        self._live = False
+        queue = self._queue
+        while not queue.empty():
+            queue.get_nowait()
 
     async def append_chunk(self, chunk: Any) -> None:
         """Append a chunk to both Redis and the live stream."""
         item: CallerStreamItem[Any] = {"type": "chunk", "chunk": chunk}
-        await self._write_to_redis(item)
-        await self._queue.put(item)
+        self.chunk_count += 1
+        await self._put_live(item)
+        await self._write_to_redis(
+            item, len(chunk) if isinstance(chunk, (str, bytes)) else 0
+        )
 
     async def append_error(self, error: RiverError) -> None:
         """Append a recoverable error."""
@@ -52,8 +287,8 @@ class RedisStreamHelper(StreamHelper[Any]):
             "error": error.to_dict(),
         }
         item: CallerStreamItem[Any] = {"type": "special", "special": special}
+        await self._put_live(item)
         await self._write_to_redis(item)
-        await self._queue.put(item)
 
     async def send_fatal_error_and_close(self, error: RiverError) -> None:
         """Send a fatal error and close the stream."""
@@ -62,12 +297,11 @@ class RedisStreamHelper(StreamHelper[Any]):
             "error": error.to_dict(),
         }
         item: CallerStreamItem[Any] = {"type": "special", "special": special}
-        await self._write_to_redis(item)
-        await self._queue.put(item)
+        await self._put_live(item)
+        await self._put_live(None)
 
-        # Write end marker to Redis
-        await self._redis.xadd(self._stream_key, {"end": "true"})
-        await self._queue.put(None)  # type: ignore
+        # Persist the error in the end marker entry
+        await self._write_end_marker(item)
 
     async def close(self) -> None:
         """Close the stream successfully."""
@@ -86,41 +320,150 @@ class RedisRiverProvider:
     provider_id: str = "redis"
     is_resumable: bool = True
 
-    def __init__(self, redis_url: str, key_prefix: str = "river:stream:"):
+    __slots__ = (
+        "_redis_url",
+        "_key_prefix",
+        "_key_prefix_bytes",
+        "_batch_size",
+        "_max_pending_writes",
+        "_dumps",
+        "_loads",
+        "_resume_idle_timeout",
+        "_maxlen",
+        "_ttl_seconds",
+        "_queue_maxsize",
+        "_offload_threshold",
+        "_max_connections",
+        "_health_check_interval",
+        "_redis_client",
+        "_reader_client",
+    )
+
+    def __init__(
+        self,
+        redis_url: str,
+        key_prefix: str = "river:stream:",
+        batch_size: int = 32,
+        max_pending_writes: int = 1024,
+        dumps: Callable[[Any], bytes | str] = orjson.dumps,
+        loads: Callable[[bytes], Any] = orjson.loads,
+        resume_idle_timeout: float = 30.0,
+        maxlen: int | None = None,
+        ttl_seconds: int | None = None,
+        queue_maxsize: int = 256,
+        offload_threshold: int | None = 1_048_576,
+        max_connections: int = 64,
+        health_check_interval: int = 30,
+    ):
         """
         Initialize Redis provider.
 
         Args:
             redis_url: Redis connection URL (e.g., "redis://localhost:6379")
             key_prefix: Prefix for Redis keys
+            batch_size: Maximum number of Redis writes sent per round-trip
+            max_pending_writes: Maximum number of writes per stream waiting
+                to be sent before appending waits for Redis
+            dumps: Serializer for stored items (orjson by default; any
+                encoder producing bytes or str, e.g. msgpack.packb)
+            loads: Deserializer matching ``dumps``; receives the raw bytes
+            resume_idle_timeout: Seconds a resume waits for new entries
+                before giving up on a stream that has not ended
+            maxlen: Approximate cap on entries kept per stream (None keeps
+                every entry)
+            ttl_seconds: Expire each stream key this long after it ends
+                (None keeps keys until deleted)
+            queue_maxsize: Maximum number of items buffered for the live
+                consumer before appending waits (0 for unbounded)
+            offload_threshold: Length from which str/bytes chunks are
+                serialized in a thread instead of on the event loop (None
+                always serializes inline)
+            max_connections: Maximum number of pooled Redis connections
+                shared by the writes of all streams of this provider
+            health_check_interval: Seconds a pooled connection may sit idle
+                before it is checked with PING on next use (0 disables)
         """
         self._redis_url = redis_url
         self._key_prefix = key_prefix
-        self._redis_client: aioredis.Redis | None = None  # type: ignore
-
-    async def _get_redis(self) -> aioredis.Redis:  # type: ignore
+        # Keys are built as bytes, which redis-py sends without encoding
+        self._key_prefix_bytes = key_prefix.encode()
+        self._batch_size = batch_size
+        self._max_pending_writes = max_pending_writes
+        self._dumps = dumps
+        self._loads = loads
+        self._resume_idle_timeout = resume_idle_timeout
+        self._maxlen = maxlen
+        self._ttl_seconds = ttl_seconds
+        self._queue_maxsize = queue_maxsize
+        self._offload_threshold = offload_threshold
+        self._max_connections = max_connections
+        self._health_check_interval = health_check_interval
+        self._redis_client: aioredis.Redis | None = None
+        self._reader_client: aioredis.Redis | None = None
+
+    async def _get_redis(self) -> aioredis.Redis:
         """Get or create Redis client."""
         if self._redis_client is None:
-            self._redis_client = await aioredis.from_url(self._redis_url)
+            # Raw bytes replies: with hiredis installed, redis-py parses them
+            # in C, and the read path relies on byte field names. A blocking
+            # pool makes commands wait for a free connection instead of
+            # failing once max_connections are in use.
+            pool = aioredis.BlockingConnectionPool.from_url(
+                self._redis_url,
+                decode_responses=False,
+                max_connections=self._max_connections,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                health_check_interval=self._health_check_interval,
+            )
+            self._redis_client = await aioredis.Redis(connection_pool=pool)
         return self._redis_client
 
-    def _make_stream_key(self, stream_storage_id: str, stream_run_id: str) -> str:
-        """Generate Redis stream key."""
-        return f"{self._key_prefix}{stream_storage_id}:{stream_run_id}"
+    async def _get_reader(self) -> aioredis.Redis:
+        """
+        Get or create the Redis client for resume reads.
+
+        Resumes hold a connection for each blocking XREAD, so they get their
+        own (unbounded) pool and can never starve the stream writers.
+        """
+        if self._reader_client is None:
+            pool = aioredis.ConnectionPool.from_url(
+                self._redis_url,
+                decode_responses=False,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                health_check_interval=self._health_check_interval,
+            )
+            self._reader_client = await aioredis.Redis(connection_pool=pool)
+        return self._reader_client
+
+    def _make_stream_key_bytes(
+        self, stream_storage_id: str, stream_run_id: str
+    ) -> bytes:
+        """Generate the Redis stream key for a new run."""
+        return _build_stream_key(self._key_prefix_bytes, stream_storage_id, stream_run_id)
 
     async def start_stream(
         self,
         stream_storage_id: str,
         runner: Callable[[StreamContext[Any, Any, Any]], Any],
         context: StreamContext[Any, Any, Any],
+        runner_is_generator: bool = False,
     ) -> AsyncIterator[CallerStreamItem[Any]]:
-        """Start a new resumable stream."""
+        """
+        Start a new resumable stream.
+
+        This provider does not set ``supports_generator_runners``, so the
+        stream builder adapts generator runners and ``runner_is_generator``
+        is always False.
+        """
         redis = await self._get_redis()
-        queue: asyncio.Queue[CallerStreamItem[Any] | None] = asyncio.Queue()
-        stream_run_id = str(uuid.uuid4())
-        stream_key = self._make_stream_key(stream_storage_id, stream_run_id)
+        queue: asyncio.Queue[CallerStreamItem[Any] | None] = asyncio.Queue(
+            maxsize=self._queue_maxsize
+        )
+        stream_run_id = os.urandom(16).hex()
+        stream_key = self._make_stream_key_bytes(stream_storage_id, stream_run_id)
         start_time = time.time()
-        chunk_count = 0
 
         # Create resumption token
         resumption_token = ResumptionToken(
@@ -132,7 +475,17 @@ class RedisRiverProvider:
         encoded_token = encode_resumption_token(resumption_token)
 
         # Create Redis-backed stream helper
-        helper = RedisStreamHelper(queue, redis, stream_key)
+        helper = RedisStreamHelper(
+            queue,
+            redis,
+            stream_key,
+            batch_size=self._batch_size,
+            max_pending_writes=self._max_pending_writes,
+            dumps=self._dumps,
+            maxlen=self._maxlen,
+            ttl_seconds=self._ttl_seconds,
+            offload_threshold=self._offload_threshold,
+        )
         context.stream = helper
 
         # Send stream start with resumption token
@@ -152,15 +505,14 @@ class RedisRiverProvider:
                 end_time = time.time()
                 end_chunk: RiverSpecialChunk = {
                     "type": "stream_end",
-                    "total_chunks": chunk_count,
+                    "total_chunks": helper.chunk_count,
                     "total_time_ms": (end_time - start_time) * 1000,
                 }
                 item: CallerStreamItem[Any] = {"type": "special", "special": end_chunk}
-                await helper._write_to_redis(item)
-                await queue.put(item)
+                await helper._put_live(item)
 
-                # Write end marker to Redis
-                await redis.xadd(stream_key, {"end": "true"})
+                # Persist stream_end in the end marker entry
+                await helper._write_end_marker(item)
             except Exception as e:
                 # Send fatal error
                 error = RiverError(
@@ -172,35 +524,38 @@ class RedisRiverProvider:
                     "error": error.to_dict(),
                 }
                 item = {"type": "special", "special": fatal_chunk}
-                await helper._write_to_redis(item)
-                await queue.put(item)
+                await helper._put_live(item)
 
-                # Write end marker
-                await redis.xadd(stream_key, {"end": "true"})
+                # Persist the error in the end marker entry
+                await helper._write_end_marker(item)
             finally:
-                await queue.put(None)  # Signal completion
+                await helper._put_live(None)  # Signal completion
 
+        # Start the Redis writer with the runner, so a client that leaves
+        # after stream_start does not strand it
+        helper.start_writer()
         # Start runner task (non-blocking)
         asyncio.create_task(run_stream())
 
         # Yield chunks from queue
-        while True:
-            item = await queue.get()
-            if item is None:
-                break
-
-            # Count regular chunks
-            if item["type"] == "chunk":
-                chunk_count += 1
-
-            yield item
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            # The runner keeps writing to Redis for later resumes
+            helper.detach_live()
 
     async def resume_stream(
         self, resumption_token: ResumptionToken
     ) -> AsyncIterator[CallerStreamItem[Any]]:
         """Resume a stream from Redis."""
-        redis = await self._get_redis()
-        stream_key = self._make_stream_key(
+        redis = await self._get_reader()
+        # Run keys are unique, so only resumes (which may repeat) are cached
+        stream_key = _cached_stream_key(
+            self._key_prefix_bytes,
             resumption_token["stream_storage_id"],
             resumption_token["stream_run_id"],
         )
@@ -214,55 +569,66 @@ class RedisRiverProvider:
             )
 
         # Read from Redis stream
-        last_id = "0-0"  # Start from beginning
-        max_attempts = 1000
-        attempts = 0
-
-        while attempts < max_attempts:
-            attempts += 1
-
-            # Read with blocking
-            result = await redis.xread({stream_key: last_id}, block=10, count=10)
+        last_id = b"0-0"  # Start from beginning
+        # Locals for the per-message loop
+        xread = redis.xread
+        loads = self._loads
+        monotonic = time.monotonic
+        idle_timeout = self._resume_idle_timeout
+        deadline = monotonic() + idle_timeout
+
+        while monotonic() < deadline:
+            # Block in Redis until entries arrive; XREAD's own timeout
+            # replaces client-side polling
+            result = cast(
+                _XReadReply,
+                await xread({stream_key: last_id}, block=_XREAD_BLOCK_MS, count=_XREAD_COUNT),
+            )
 
             if not result:
-                # No new data, check if stream ended
-                # In a production system, you'd have better end detection
-                await asyncio.sleep(0.01)
+                # Nothing new for a whole block: stop if the stream has
+                # expired or been deleted rather than wait out the deadline
+                if not await redis.exists(stream_key):
+                    raise RiverError(
+                        message="Stream not found or has expired",
+                        error_type=RiverErrorType.STREAM_NOT_FOUND,
+                    )
                 continue
 
-            # Process messages
+            # Progress: the idle deadline starts over
+            deadline = monotonic() + idle_timeout
+
+            # Parse the whole batch first, then yield it without awaiting
+            # in between
             for _stream_key, messages in result:
-                for msg_id, fields in messages:
-                    last_id = msg_id.decode() if isinstance(msg_id, bytes) else msg_id
-
-                    # Check for end marker
-                    if b"end" in fields or "end" in fields:
-                        return
-
-                    # Parse and yield item
-                    data_field = fields.get(b"data") or fields.get("data")
-                    if data_field:
-                        data_str = (
-                            data_field.decode()
-                            if isinstance(data_field, bytes)
-                            else data_field
-                        )
-                        data = json.loads(data_str)
-                        item = data["item"]
-                        yield item
-
-                        # Check if this was a fatal error (stream should end)
-                        if item.get("type") == "special":
-                            special = item.get("special", {})
-                            if special.get("type") in [
-                                "stream_fatal_error",
-                                "stream_end",
-                            ]:
-                                return
-
-        # Safety limit reached
+                items: list[CallerStreamItem[Any]] = []
+                ended = False
+                for _msg_id, fields in messages:
+                    # The end marker entry may carry the final item
+                    data = fields.get(_DATA_KEY)
+                    if data is not None:
+                        item: CallerStreamItem[Any] = loads(data)
+                        items.append(item)
+                        # Stop after a special that ends the stream
+                        if (
+                            item["type"] == "special"
+                            and item["special"]["type"] in _TERMINAL_SPECIALS
+                        ):
+                            ended = True
+                            break
+                    if _END_KEY in fields:
+                        ended = True
+                        break
+                last_id = messages[-1][0]
+
+                for item in items:
+                    yield item
+                if ended:
+                    return
+
+        # No new entries within the idle timeout
         raise RiverError(
-            message="Resume safety limit reached",
+            message="Resume timed out waiting for new stream entries",
             error_type=RiverErrorType.PROVIDER,
         )
 
@@ -270,6 +636,17 @@ class RedisRiverProvider:
 def redis_provider(
     redis_url: str = "redis://localhost:6379",
     key_prefix: str = "river:stream:",
+    batch_size: int = 32,
+    max_pending_writes: int = 1024,
+    dumps: Callable[[Any], bytes | str] = orjson.dumps,
+    loads: Callable[[bytes], Any] = orjson.loads,
+    resume_idle_timeout: float = 30.0,
+    maxlen: int | None = None,
+    ttl_seconds: int | None = None,
+    queue_maxsize: int = 256,
+    offload_threshold: int | None = 1_048_576,
+    max_connections: int = 64,
+    health_check_interval: int = 30,
 ) -> RedisRiverProvider:
     """
     Create a Redis provider for resumable streams.
@@ -277,6 +654,26 @@ def redis_provider(
     Args:
         redis_url: Redis connection URL
         key_prefix: Prefix for Redis stream keys
+        batch_size: Maximum number of Redis writes sent per round-trip
+        max_pending_writes: Maximum number of writes per stream waiting to be
+            sent before appending waits for Redis
+        dumps: Serializer for stored items (orjson by default)
+        loads: Deserializer matching ``dumps``
+        resume_idle_timeout: Seconds a resume waits for new entries before
+            giving up on a stream that has not ended
+        maxlen: Approximate cap on entries kept per stream (None keeps every
+            entry)
+        ttl_seconds: Expire each stream key this long after it ends (None
+            keeps keys until deleted)
+        queue_maxsize: Maximum number of items buffered for the live consumer
+            before appending waits (0 for unbounded)
+        offload_threshold: Length from which str/bytes chunks are serialized
+            in a thread instead of on the event loop (None always serializes
+            inline)
+        max_connections: Maximum number of pooled Redis connections shared by
+            the writes of all streams of this provider
+        health_check_interval: Seconds a pooled connection may sit idle before
+            it is checked with PING on next use (0 disables)
 
     Returns:
         A configured Redis provider
@@ -293,4 +690,18 @@ def redis_provider(
         )
         ```
     """
-    return RedisRiverProvider(redis_url=redis_url, key_prefix=key_prefix)
+    return RedisRiverProvider(
+        redis_url=redis_url,
+        key_prefix=key_prefix,
+        batch_size=batch_size,
+        max_pending_writes=max_pending_writes,
+        dumps=dumps,
+        loads=loads,
+        resume_idle_timeout=resume_idle_timeout,
+        maxlen=maxlen,
+        ttl_seconds=ttl_seconds,
+        queue_maxsize=queue_maxsize,
+        offload_threshold=offload_threshold,
+        max_connections=max_connections,
+        health_check_interval=health_check_interval,
+    )
@@ -348,3 +348,417 @@ async def test_redis_provider_concurrent_streams(redis_url, clean_redis):
     assert len(results[0]) == 3
     assert len(results[1]) == 4
     assert len(results[2]) == 2
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_maxlen_and_ttl(redis_url, redis_client, clean_redis):
+    """Test that streams are trimmed and expire once ended."""
+
+    async def test_runner(ctx: StreamContext):
+        for i in range(500):
+            await ctx.stream.append_chunk(i)
+        await ctx.stream.close()
+
+    provider = redis_provider(
+        redis_url=redis_url, key_prefix="test:bounded:", maxlen=100, ttl_seconds=60
+    )
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    async for item in provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        pass
+
+    await asyncio.sleep(0.1)
+
+    keys = await redis_client.keys("test:bounded:*")
+    assert len(keys) == 1
+    assert await redis_client.xlen(keys[0]) < 500
+    assert 0 < await redis_client.ttl(keys[0]) <= 60
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_runner_continues_after_disconnect(
+    redis_url, redis_client, clean_redis
+):
+    """Test that a full live queue does not block the runner once the client leaves."""
+    finished = asyncio.Event()
+
+    async def test_runner(ctx: StreamContext):
+        for i in range(50):
+            await ctx.stream.append_chunk(i)
+        await ctx.stream.close()
+        finished.set()
+
+    provider = redis_provider(
+        redis_url=redis_url, key_prefix="test:detach:", queue_maxsize=4
+    )
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    gen = provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    )
+    async for item in gen:
+        if item["type"] == "chunk":
+            break
+    await gen.aclose()
+
+    await asyncio.wait_for(finished.wait(), timeout=5)
+
+    # Wait for the writer to flush every entry
+    stream_length = 0
+    for _ in range(50):
+        keys = await redis_client.keys("test:detach:*")
+        stream_length = await redis_client.xlen(keys[0]) if keys else 0
+        if stream_length == 51:
+            break
+        await asyncio.sleep(0.05)
+    assert stream_length == 51  # chunks + end marker holding stream_end
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_resume_stream_deleted(redis_url, redis_client, clean_redis):
+    """Test that a resume stops once its stream is deleted, before the timeout."""
+    from river_core.errors import RiverError, RiverErrorType
+    from river_core.helpers import decode_resumption_token
+
+    release = asyncio.Event()
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("first")
+        await release.wait()
+        await ctx.stream.close()
+
+    provider = redis_provider(
+        redis_url=redis_url, key_prefix="test:deleted:", resume_idle_timeout=30
+    )
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    gen = provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    )
+    start = await gen.__anext__()
+    token = decode_resumption_token(start["special"]["encoded_resumption_token"])
+    await gen.__anext__()  # First chunk
+    await asyncio.sleep(0.1)
+
+    resumed = []
+
+    async def resume():
+        async for item in provider.resume_stream(token):
+            resumed.append(item)
+
+    resume_task = asyncio.create_task(resume())
+    await asyncio.sleep(0.1)
+    await redis_client.delete(*await redis_client.keys("test:deleted:*"))
+
+    with pytest.raises(RiverError) as exc_info:
+        await asyncio.wait_for(resume_task, timeout=5)
+    assert exc_info.value.error_type == RiverErrorType.STREAM_NOT_FOUND
+    assert [item["chunk"] for item in resumed] == ["first"]
+
+    release.set()
+    await gen.aclose()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_large_chunks_resume(redis_url, clean_redis):
+    """Test that chunks serialized off the event loop are persisted in order."""
+    from river_core.helpers import decode_resumption_token
+
+    chunks = ["x" * 20000, "small", "y" * 20000]
+
+    async def test_runner(ctx: StreamContext):
+        for chunk in chunks:
+            await ctx.stream.append_chunk(chunk)
+        await ctx.stream.close()
+
+    provider = redis_provider(redis_url=redis_url, key_prefix="test:large-chunks:")
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    resumption_token = None
+    async for item in provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "special" and item["special"]["type"] == "stream_start":
+            resumption_token = item["special"]["encoded_resumption_token"]
+
+    resumed = []
+    async for item in provider.resume_stream(decode_resumption_token(resumption_token)):
+        resumed.append(item)
+
+    assert [item["chunk"] for item in resumed[:-1]] == chunks
+    assert resumed[-1]["special"]["type"] == "stream_end"
+    assert resumed[-1]["special"]["total_chunks"] == 3
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_resume_fatal_error(redis_url, redis_client, clean_redis):
+    """Test that a runner failure is stored with the end marker and replayed."""
+    from river_core.helpers import decode_resumption_token
+
+    async def failing_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("before-failure")
+        raise ValueError("Runner failed")
+
+    provider = redis_provider(redis_url=redis_url, key_prefix="test:resume-fatal:")
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(failing_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    resumption_token = None
+    async for item in provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    ):
+        if item["type"] == "special" and item["special"]["type"] == "stream_start":
+            resumption_token = item["special"]["encoded_resumption_token"]
+
+    keys = await redis_client.keys("test:resume-fatal:*")
+    assert await redis_client.xlen(keys[0]) == 2  # chunk + end marker holding the error
+
+    resumed = []
+    async for item in provider.resume_stream(decode_resumption_token(resumption_token)):
+        resumed.append(item)
+
+    assert resumed[0] == {"type": "chunk", "chunk": "before-failure"}
+    assert resumed[1]["special"]["type"] == "stream_fatal_error"
+    assert resumed[1]["special"]["error"]["message"] == "Runner failed"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_resume_idle_timeout(redis_url, clean_redis):
+    """Test that a resume outlives its idle timeout while entries keep arriving."""
+    from river_core.errors import RiverError, RiverErrorType
+    from river_core.helpers import decode_resumption_token
+
+    release = asyncio.Event()
+
+    async def slow_runner(ctx: StreamContext):
+        for i in range(3):
+            await ctx.stream.append_chunk(i)
+            await asyncio.sleep(0.8)
+        await release.wait()
+        await ctx.stream.close()
+
+    provider = redis_provider(
+        redis_url=redis_url, key_prefix="test:idle:", resume_idle_timeout=1.5
+    )
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(slow_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    gen = provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    )
+    start = await gen.__anext__()
+    token = decode_resumption_token(start["special"]["encoded_resumption_token"])
+
+    async def consume_live():
+        async for _item in gen:
+            pass
+
+    live_task = asyncio.create_task(consume_live())
+    await asyncio.sleep(0.1)
+
+    # Chunks arrive every 0.8s for 2.4s, longer than the idle timeout
+    resumed = []
+    with pytest.raises(RiverError) as exc_info:
+        async for item in provider.resume_stream(token):
+            resumed.append(item["chunk"])
+    assert exc_info.value.error_type == RiverErrorType.PROVIDER
+    assert resumed == [0, 1, 2]
+
+    release.set()
+    await live_task
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_close_after_stream_start(redis_url, clean_redis):
+    """Test that closing right after stream_start leaves no task behind."""
+
+    async def test_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("never sent")
+        await ctx.stream.close()
+
+    provider = redis_provider(redis_url=redis_url, key_prefix="test:early-close:")
+
+    stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(test_runner)
+    )
+
+    context = StreamContext()
+    context.input = TestInput(message="test")
+
+    tasks_before = asyncio.all_tasks()
+    gen = provider.start_stream(
+        stream_storage_id=stream.stream_storage_id,
+        runner=stream.runner,
+        context=context,
+    )
+    start = await gen.__anext__()
+    assert start["special"]["type"] == "stream_start"
+    await gen.aclose()
+
+    assert asyncio.all_tasks() == tasks_before
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_provider_resumes_do_not_starve_writes(redis_url, clean_redis):
+    """Test that idle resumes do not take the connections writers need."""
+    from river_core.helpers import decode_resumption_token
+
+    release = asyncio.Event()
+
+    async def idle_runner(ctx: StreamContext):
+        await ctx.stream.append_chunk("first")
+        await release.wait()
+        await ctx.stream.close()
+
+    async def writing_runner(ctx: StreamContext):
+        for i in range(20):
+            await ctx.stream.append_chunk(i)
+        await ctx.stream.close()
+
+    provider = redis_provider(
+        redis_url=redis_url, key_prefix="test:pool:", max_connections=2
+    )
+
+    idle_stream = (
+        create_river_stream().input_schema(TestInput).provider(provider).runner(idle_runner)
+    )
+    writing_stream = (
+        create_river_stream()
+        .input_schema(TestInput)
+        .provider(provider)
+        .runner(writing_runner)
+    )
+
+    redis = await provider._get_redis()
+
+    # Three resumes blocked waiting for entries of idle streams
+    live_tasks = []
+    resume_tasks = []
+    for _ in range(3):
+        context = StreamContext()
+        context.input = TestInput(message="idle")
+        gen = provider.start_stream(
+            stream_storage_id=idle_stream.stream_storage_id,
+            runner=idle_stream.runner,
+            context=context,
+        )
+        start = await gen.__anext__()
+        token = decode_resumption_token(start["special"]["encoded_resumption_token"])
+
+        async def consume(gen=gen):
+            async for _item in gen:
+                pass
+
+        async def resume(token=token):
+            return [item async for item in provider.resume_stream(token)]
+
+        live_tasks.append(asyncio.create_task(consume()))
+        # Wait for the first chunk so the resume finds the stream
+        stream_key = provider._make_stream_key_bytes(
+            token["stream_storage_id"], token["stream_run_id"]
+        )
+        while not await redis.exists(stream_key):
+            await asyncio.sleep(0.01)
+        resume_tasks.append(asyncio.create_task(resume()))
+    await asyncio.sleep(0.1)
+
+    # A stream written meanwhile is fully persisted
+    context = StreamContext()
+    context.input = TestInput(message="writer")
+    resumption_token = None
+    async for item in provider.start_stream(
+        stream_storage_id=writing_stream.stream_storage_id,
+        runner=writing_stream.runner,
+        context=context,
+    ):
+        if item["type"] == "special" and item["special"]["type"] == "stream_start":
+            resumption_token = item["special"]["encoded_resumption_token"]
+
+    resumed = [
+        item["chunk"]
+        async for item in provider.resume_stream(decode_resumption_token(resumption_token))
+        if item["type"] == "chunk"
+    ]
+    assert resumed == list(range(20))
+
+    release.set()
+    await asyncio.gather(*live_tasks)
+    for task in resume_tasks:
+        assert (await task)[0]["chunk"] == "first"